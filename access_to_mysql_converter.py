@@ -23,8 +23,10 @@ Requirements:
 import os
 import sys
 import logging
+import logging.handlers
 import json
 import traceback
+import multiprocessing
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
@@ -33,6 +35,7 @@ import re
 try:
     import pyodbc
     import mysql.connector
+    from mysql.connector import pooling
     import pandas as pd
 except ImportError as e:
     print(f"Missing required package: {e}")
@@ -40,16 +43,33 @@ except ImportError as e:
     print("pip install pyodbc mysql-connector-python pandas")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional: the report is written with the json module instead
+
+from mysql_bulk_load import sanitize_identifier
+
+
+# Access system and temporary table names (MSysObjects, ~TMPCLP..., etc.)
+_SYSTEM_TABLE_RE = re.compile(r'^(MSys|~)')
+
 
 class AccessToMySQLConverter:
     """Converts MS Access databases to MySQL databases with full structure and data migration."""
     
-    def __init__(self, source_dir: str, mysql_config: Dict[str, str], log_dir: str = "logs"):
+    def __init__(self, source_dir: str, mysql_config: Dict[str, str], log_dir: str = "logs",
+                 parallelism: int = 1):
         self.source_dir = Path(source_dir)
         self.mysql_config = mysql_config
         self.log_dir = Path(log_dir)
+        self.parallelism = parallelism
         self.log_dir.mkdir(exist_ok=True)
         
+        # MySQL connection pool, created on first use; subclasses that use threads may enlarge it
+        self.mysql_pool = None
+        self.mysql_pool_size = min(32, max(1, self.parallelism) * 2)
+        
         # Setup logging
         self.setup_logging()
         
@@ -61,6 +81,7 @@ class AccessToMySQLConverter:
             'tables_converted': 0,
             'tables_failed': 0,
             'records_migrated': 0,
+            'records_skipped': 0,
             'relationships_created': 0
         }
         
@@ -81,9 +102,22 @@ class AccessToMySQLConverter:
             'LONGBINARY': 'LONGBLOB',
             'BINARY': 'VARBINARY(255)'
         }
+        
+        # Dispatch table keyed by lowercase Access type name: size -> MySQL type
+        self._type_dispatch = {
+            access_type.lower(): (lambda size, mysql_type=mysql_type: mysql_type)
+            for access_type, mysql_type in self.type_mapping.items()
+        }
+        self._type_dispatch['text'] = self._convert_text_type
     
     def setup_logging(self):
         """Setup comprehensive logging system."""
+        self.logger = logging.getLogger(__name__)
+        if logging.getLogger().handlers:
+            # Already set up, e.g. in a worker process sending its records to the
+            # parent's handlers (see _init_conversion_worker); log there, not to a new file
+            return
+        
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_file = self.log_dir / f"access_to_mysql_{timestamp}.log"
         
@@ -95,7 +129,6 @@ class AccessToMySQLConverter:
                 logging.StreamHandler(sys.stdout)
             ]
         )
-        self.logger = logging.getLogger(__name__)
         self.logger.info("MS Access to MySQL Converter initialized")
         self.logger.info(f"Source directory: {self.source_dir}")
         self.logger.info(f"Log file: {log_file}")
@@ -104,15 +137,28 @@ class AccessToMySQLConverter:
         """Find all MS Access database files in the source directory."""
         self.logger.info("Scanning for MS Access database files...")
         
-        access_extensions = ['.mdb', '.accdb']
+        access_extensions = ('.mdb', '.accdb')
         databases = []
-        
+
+        # Walk the tree once with os.scandir instead of one rglob pass per extension
+        pending_dirs = [str(self.source_dir)]
+        while pending_dirs:
+            current_dir = pending_dirs.pop()
+            try:
+                with os.scandir(current_dir) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending_dirs.append(entry.path)
+                        elif entry.name.lower().endswith(access_extensions) and entry.is_file():
+                            databases.append(Path(entry.path))
+            except OSError as e:
+                self.logger.warning(f"Could not scan directory {current_dir}: {e}")
+
+        databases.sort()
         for ext in access_extensions:
-            pattern = f"**/*{ext}"
-            found_files = list(self.source_dir.rglob(pattern))
-            databases.extend(found_files)
-            self.logger.info(f"Found {len(found_files)} {ext} files")
-        
+            found_count = sum(1 for db in databases if db.suffix.lower() == ext)
+            self.logger.info(f"Found {found_count} {ext} files")
+
         self.stats['databases_found'] = len(databases)
         self.logger.info(f"Total databases found: {len(databases)}")
         
@@ -123,14 +169,7 @@ class AccessToMySQLConverter:
     
     def sanitize_name(self, name: str) -> str:
         """Sanitize database/table names for MySQL compatibility."""
-        # Remove or replace invalid characters
-        sanitized = re.sub(r'[^\w]', '_', name)
-        # Ensure it doesn't start with a number
-        if sanitized[0].isdigit():
-            sanitized = f"db_{sanitized}"
-        # Limit length
-        sanitized = sanitized[:64]
-        return sanitized.lower()
+        return sanitize_identifier(name)
     
     def get_access_connection_string(self, db_path: Path) -> str:
         """Generate connection string for MS Access database."""
@@ -256,9 +295,19 @@ class AccessToMySQLConverter:
             return None
     
     def connect_to_mysql(self) -> Optional[mysql.connector.MySQLConnection]:
-        """Connect to MySQL database."""
+        """Borrow a MySQL connection from the pool; close() returns it to the pool."""
         try:
-            conn = mysql.connector.connect(**self.mysql_config)
+            if self.mysql_pool is None:
+                if not getattr(mysql.connector, 'HAVE_CEXT', False):
+                    self.logger.warning("mysql-connector C extension not available, "
+                                        "using the slower pure-Python protocol")
+                self.mysql_pool = pooling.MySQLConnectionPool(
+                    pool_name="access_to_mysql",
+                    pool_size=self.mysql_pool_size,
+                    # Prefer the C extension; an explicit use_pure in the config still wins
+                    **{'use_pure': False, **self.mysql_config}
+                )
+            conn = self.mysql_pool.get_connection()
             self.logger.info("Connected to MySQL server")
             return conn
         except Exception as e:
@@ -276,7 +325,7 @@ class AccessToMySQLConverter:
                 for table_info in cursor.tables(tableType='TABLE'):
                     table_name = table_info.table_name
                     # Skip system tables
-                    if not table_name.startswith('MSys'):
+                    if not _SYSTEM_TABLE_RE.match(table_name):
                         tables.append(table_name)
                         
                 if tables:
@@ -290,7 +339,7 @@ class AccessToMySQLConverter:
                 cursor.execute("SELECT Name FROM MSysObjects WHERE Type=1 AND Flags=0")
                 for row in cursor.fetchall():
                     table_name = row[0]
-                    if not table_name.startswith('MSys') and not table_name.startswith('~'):
+                    if not _SYSTEM_TABLE_RE.match(table_name):
                         tables.append(table_name)
                         
                 if tables:
@@ -305,7 +354,7 @@ class AccessToMySQLConverter:
                 cursor.execute("SELECT DISTINCT TABLE_NAME FROM INFORMATION_SCHEMA.TABLES WHERE TABLE_TYPE = 'BASE TABLE'")
                 for row in cursor.fetchall():
                     table_name = row[0]
-                    if not table_name.startswith('MSys'):
+                    if not _SYSTEM_TABLE_RE.match(table_name):
                         tables.append(table_name)
                         
                 if tables:
@@ -361,8 +410,8 @@ class AccessToMySQLConverter:
                 
                 # Method 2: Query the table directly to get column info
                 try:
-                    # Get first row to determine column names and types
-                    cursor.execute(f"SELECT TOP 1 * FROM [{table_name}]")
+                    # Zero-row query: the description is populated without fetching data
+                    cursor.execute(f"SELECT * FROM [{table_name}] WHERE 1=0")
                     
                     # Get column information from cursor description
                     if cursor.description:
@@ -447,66 +496,73 @@ class AccessToMySQLConverter:
         }
         return type_map.get(odbc_type, 'TEXT')
     
+    @staticmethod
+    def _convert_text_type(size: int) -> str:
+        """Map an Access TEXT column to VARCHAR or TEXT depending on its size."""
+        if size > 0:
+            return f'VARCHAR({size})' if size <= 255 else 'TEXT'
+        return 'VARCHAR(255)'
+    
+    @staticmethod
+    def _convert_unknown_type(size: int) -> str:
+        """Default mapping for unknown Access types."""
+        return 'TEXT'
+    
     def convert_column_type(self, access_type: str, size: int) -> str:
         """Convert Access column type to MySQL type."""
-        access_type = access_type.upper()
-        
-        if access_type in self.type_mapping:
-            mysql_type = self.type_mapping[access_type]
-        else:
-            # Default mapping for unknown types
-            mysql_type = 'TEXT'
-        
-        # Handle TEXT fields with size
-        if access_type == 'TEXT' and size > 0:
-            if size <= 255:
-                mysql_type = f'VARCHAR({size})'
-            else:
-                mysql_type = 'TEXT'
-        
-        return mysql_type
+        converter = self._type_dispatch.get(access_type.lower(), self._convert_unknown_type)
+        return converter(size)
     
-    def create_mysql_table(self, mysql_conn: mysql.connector.MySQLConnection, 
-                          db_name: str, table_name: str, structure: Dict[str, Any]) -> bool:
-        """Create MySQL table with converted structure."""
-        try:
-            cursor = mysql_conn.cursor()
+    def build_create_table_sql(self, db_name: str, table_name: str, structure: Dict[str, Any]) -> str:
+        """Build the CREATE TABLE statement for a converted table structure."""
+        columns_sql = []
+        primary_key_columns = structure.get('primary_keys', [])
+        
+        for col in structure['columns']:
+            col_name = self.sanitize_name(col['name'])
+            mysql_type = self.convert_column_type(col['type'], col.get('size', 0))
             
-            # Build CREATE TABLE statement
-            columns_sql = []
-            primary_key_columns = structure.get('primary_keys', [])
+            col_sql = f"`{col_name}` {mysql_type}"
             
-            for col in structure['columns']:
-                col_name = self.sanitize_name(col['name'])
-                mysql_type = self.convert_column_type(col['type'], col.get('size', 0))
-                
-                col_sql = f"`{col_name}` {mysql_type}"
-                
-                # Handle nullability
-                if not col.get('nullable', True) or col['name'] in primary_key_columns:
-                    col_sql += " NOT NULL"
-                
-                columns_sql.append(col_sql)
-            
-            # Add primary key constraint if exists
-            if primary_key_columns:
-                pk_cols = [f"`{self.sanitize_name(col)}`" for col in primary_key_columns]
-                columns_sql.append(f"PRIMARY KEY ({', '.join(pk_cols)})")
+            # Handle nullability
+            if not col.get('nullable', True) or col['name'] in primary_key_columns:
+                col_sql += " NOT NULL"
             
-            create_sql = f"""
+            columns_sql.append(col_sql)
+        
+        # Add primary key constraint if exists
+        if primary_key_columns:
+            pk_cols = [f"`{self.sanitize_name(col)}`" for col in primary_key_columns]
+            columns_sql.append(f"PRIMARY KEY ({', '.join(pk_cols)})")
+        
+        return f"""
             CREATE TABLE `{db_name}`.`{table_name}` (
                 {',\n    '.join(columns_sql)}
             ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
             """
-            
-            cursor.execute(create_sql)
-            mysql_conn.commit()
-            self.logger.info(f"Created MySQL table: {db_name}.{table_name}")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Failed to create table {table_name}: {e}")
-            return False
+    
+    def create_mysql_tables(self, mysql_conn: mysql.connector.MySQLConnection,
+                           db_name: str, structures: Dict[str, Dict[str, Any]]) -> List[str]:
+        """Create all tables of a database, one statement per table, on a single cursor.
+        
+        Returns the source names of the tables that were created; a table that
+        fails is logged and skipped.
+        """
+        cursor = mysql_conn.cursor()
+        created = []
+        
+        for table_name, structure in structures.items():
+            sanitized_table_name = self.sanitize_name(table_name)
+            try:
+                cursor.execute(self.build_create_table_sql(db_name, sanitized_table_name, structure))
+                created.append(table_name)
+                self.logger.info(f"Created MySQL table: {db_name}.{sanitized_table_name}")
+            except Exception as e:
+                self.logger.error(f"Failed to create table {sanitized_table_name}: {e}")
+        
+        mysql_conn.commit()
+        cursor.close()
+        return created
     
     def migrate_table_data(self, access_conn: pyodbc.Connection, mysql_conn: mysql.connector.MySQLConnection,
                           source_table: str, target_db: str, target_table: str) -> int:
@@ -540,9 +596,6 @@ class AccessToMySQLConverter:
             # Sanitize column names
             df.columns = [self.sanitize_name(col) for col in df.columns]
             
-            # Convert data types and handle None values
-            df = df.where(pd.notnull(df), None)
-            
             # Handle common data type issues in old MDB files
             for col in df.columns:
                 # Convert Access Date/Time to proper format
@@ -556,6 +609,8 @@ class AccessToMySQLConverter:
                 # Handle binary data that might cause issues
                 if df[col].dtype == 'object':
                     df[col] = df[col].astype(str).replace('nan', None)
+                    # Truncate very long strings
+                    df[col] = df[col].str.slice(0, 65535)
             
             # Insert data into MySQL
             cursor = mysql_conn.cursor()
@@ -568,42 +623,32 @@ class AccessToMySQLConverter:
             # Insert in smaller batches for old MDB files
             batch_size = 500  # Reduced batch size for better compatibility
             total_rows = len(df)
+            skipped_rows = 0
+            
+            # Extract the values once as objects with None written in at the missing
+            # cells (no second frame is built); slicing the ndarray per batch is a zero-copy view
+            rows = df.to_numpy(dtype=object)
+            rows[df.isna().to_numpy()] = None
             
             for i in range(0, total_rows, batch_size):
-                batch = df.iloc[i:i+batch_size]
-                values = []
-                
-                for row in batch.values:
-                    # Clean up each row for old MDB compatibility
-                    clean_row = []
-                    for val in row:
-                        if pd.isna(val) or val == 'nan':
-                            clean_row.append(None)
-                        elif isinstance(val, str) and len(val) > 65535:  # Truncate very long strings
-                            clean_row.append(val[:65535])
-                        else:
-                            clean_row.append(val)
-                    values.append(tuple(clean_row))
+                values = [tuple(row) for row in rows[i:i+batch_size].tolist()]
                 
                 try:
                     cursor.executemany(insert_sql, values)
                     mysql_conn.commit()
                     
-                    self.logger.debug(f"Inserted batch {i//batch_size + 1} "
-                                    f"({min(i+batch_size, total_rows)}/{total_rows} rows)")
+                    self.logger.debug("Inserted batch %d (%d/%d rows)",
+                                      i//batch_size + 1, min(i+batch_size, total_rows), total_rows)
                 except Exception as e:
-                    self.logger.warning(f"Batch insert failed, trying individual inserts: {e}")
-                    # Try inserting rows individually
-                    for row_values in values:
-                        try:
-                            cursor.execute(insert_sql, row_values)
-                        except Exception as row_e:
-                            self.logger.warning(f"Skipping problematic row: {row_e}")
-                            continue
+                    self.logger.warning(f"Batch insert failed, splitting batch to isolate problematic rows: {e}")
+                    half = len(values) // 2
+                    skipped_rows += self.insert_batch_bisect(cursor, insert_sql, values[:half])
+                    skipped_rows += self.insert_batch_bisect(cursor, insert_sql, values[half:])
                     mysql_conn.commit()
             
-            self.logger.info(f"Migrated {total_rows} records from {source_table} to {target_table}")
-            return total_rows
+            self.record_skipped_rows(source_table, skipped_rows)
+            self.logger.info(f"Migrated {total_rows - skipped_rows} records from {source_table} to {target_table}")
+            return total_rows - skipped_rows
             
         except Exception as e:
             self.logger.error(f"Failed to migrate data for table {source_table}: {e}")
@@ -611,6 +656,32 @@ class AccessToMySQLConverter:
             self.logger.debug(traceback.format_exc())
             return 0
     
+    def insert_batch_bisect(self, cursor, insert_sql: str, values: List[tuple]) -> int:
+        """Insert a batch, recursively halving it on failure to isolate bad rows.
+        
+        Only rows that still fail on their own are skipped, so sparse bad data costs
+        O(log N) round-trips per bad row instead of one round-trip per row. Returns
+        the number of rows skipped.
+        """
+        if not values:
+            return 0
+        try:
+            cursor.executemany(insert_sql, values)
+            return 0
+        except Exception as e:
+            if len(values) == 1:
+                self.logger.warning(f"Skipping problematic row: {e}")
+                return 1
+            half = len(values) // 2
+            return (self.insert_batch_bisect(cursor, insert_sql, values[:half])
+                    + self.insert_batch_bisect(cursor, insert_sql, values[half:]))
+    
+    def record_skipped_rows(self, source_table: str, skipped_rows: int):
+        """Count rows dropped from a table in the statistics, so the report shows them."""
+        if skipped_rows:
+            self.stats['records_skipped'] += skipped_rows
+            self.logger.warning(f"Skipped {skipped_rows} rows of {source_table} that MySQL rejected")
+    
     def get_relationships(self, access_conn: pyodbc.Connection) -> List[Dict[str, str]]:
         """Extract relationship information from Access database."""
         relationships = []
@@ -655,23 +726,28 @@ class AccessToMySQLConverter:
                 self.logger.warning(f"No tables found in {access_db_path.name}")
                 return True
             
+            # Get table structures up front so all DDL goes to MySQL together
+            structures = {}
+            for table_name in tables:
+                structure = self.get_table_structure(access_conn, table_name)
+                if not structure['columns']:
+                    self.logger.warning(f"Skipping table {table_name} - no structure found")
+                    continue
+                structures[table_name] = structure
+            
+            # Create MySQL tables
+            created_tables = set(self.create_mysql_tables(mysql_conn, db_name, structures))
+            
             # Convert each table
             converted_tables = 0
             total_records = 0
             
-            for table_name in tables:
+            for table_name in structures:
                 try:
                     sanitized_table_name = self.sanitize_name(table_name)
                     self.logger.info(f"Converting table: {table_name} -> {sanitized_table_name}")
                     
-                    # Get table structure
-                    structure = self.get_table_structure(access_conn, table_name)
-                    if not structure['columns']:
-                        self.logger.warning(f"Skipping table {table_name} - no structure found")
-                        continue
-                    
-                    # Create MySQL table
-                    if self.create_mysql_table(mysql_conn, db_name, sanitized_table_name, structure):
+                    if table_name in created_tables:
                         # Migrate data
                         records = self.migrate_table_data(access_conn, mysql_conn, 
                                                         table_name, db_name, sanitized_table_name)
@@ -728,27 +804,59 @@ class AccessToMySQLConverter:
             return self.get_summary_report(start_time)
         
         # Convert each database
-        for db_path in databases:
+        workers = min(self.parallelism, len(databases))
+        if workers > 1:
+            # Databases are independent; each worker process builds its own converter and connections.
+            # Workers are spawned, not forked: ODBC and COM handles are not fork-safe
+            self.logger.info(f"Converting {len(databases)} databases with {workers} worker processes")
+            context = multiprocessing.get_context('spawn')
+            
+            # Workers send their log records here, and this process writes them to its own log
+            log_queue = context.Queue()
+            log_listener = logging.handlers.QueueListener(log_queue, *logging.getLogger().handlers,
+                                                          respect_handler_level=True)
+            log_listener.start()
+            init_args = (type(self), str(self.source_dir), self.mysql_config, str(self.log_dir), log_queue)
             try:
-                self.logger.info(f"\n{'='*80}")
-                self.logger.info(f"Processing database: {db_path}")
-                self.logger.info(f"{'='*80}")
-                
-                if self.convert_database(db_path):
+                with context.Pool(processes=workers, initializer=_init_conversion_worker,
+                                  initargs=init_args) as pool:
+                    for success, db_stats in pool.imap_unordered(_process_database_in_worker, databases):
+                        for key, value in db_stats.items():
+                            self.stats[key] += value
+                        self.stats['databases_converted' if success else 'databases_failed'] += 1
+                    # Let the workers exit on their own, so their last records reach the queue
+                    pool.close()
+                    pool.join()
+            finally:
+                log_listener.stop()
+        else:
+            for db_path in databases:
+                if self.process_database(db_path):
                     self.stats['databases_converted'] += 1
-                    self.logger.info(f"✅ Successfully converted: {db_path.name}")
                 else:
                     self.stats['databases_failed'] += 1
-                    self.logger.error(f"❌ Failed to convert: {db_path.name}")
-                    
-            except Exception as e:
-                self.stats['databases_failed'] += 1
-                self.logger.error(f"❌ Unexpected error processing {db_path}: {e}")
-                self.logger.error(traceback.format_exc())
-                continue
         
         return self.get_summary_report(start_time)
     
+    def process_database(self, db_path: Path) -> bool:
+        """Convert a single database, logging the outcome instead of raising."""
+        try:
+            self.logger.info(f"\n{'='*80}")
+            self.logger.info(f"Processing database: {db_path}")
+            self.logger.info(f"{'='*80}")
+            
+            if self.convert_database(db_path):
+                self.logger.info(f"✅ Successfully converted: {db_path.name}")
+                return True
+            
+            self.logger.error(f"❌ Failed to convert: {db_path.name}")
+            return False
+            
+        except Exception as e:
+            self.logger.error(f"❌ Unexpected error processing {db_path}: {e}")
+            self.logger.error(traceback.format_exc())
+            return False
+    
     def get_summary_report(self, start_time: datetime) -> Dict[str, Any]:
         """Generate and log summary report."""
         end_time = datetime.now()
@@ -775,6 +883,7 @@ class AccessToMySQLConverter:
         self.logger.info(f"  Tables Converted: {self.stats['tables_converted']}")
         self.logger.info(f"  Tables Failed: {self.stats['tables_failed']}")
         self.logger.info(f"  Records Migrated: {self.stats['records_migrated']}")
+        self.logger.info(f"  Records Skipped: {self.stats['records_skipped']}")
         self.logger.info(f"  Relationships Created: {self.stats['relationships_created']}")
         
         success_rate = (self.stats['databases_converted'] / max(self.stats['databases_found'], 1)) * 100
@@ -782,8 +891,12 @@ class AccessToMySQLConverter:
         
         # Save report to JSON
         report_file = self.log_dir / f"conversion_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, default=str)
+        if orjson is not None:
+            with open(report_file, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2, default=str))
+        else:
+            with open(report_file, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, default=str)
         
         self.logger.info(f"\nDetailed report saved to: {report_file}")
         self.logger.info(f"{'='*80}")
@@ -791,6 +904,30 @@ class AccessToMySQLConverter:
         return report
 
 
+# Converter instance owned by a worker process (see run_conversion)
+_worker_converter = None
+
+
+def _init_conversion_worker(converter_class, source_dir: str, mysql_config: Dict[str, str], log_dir: str,
+                            log_queue):
+    """Build one converter per worker process; connections are never shared across processes.
+    
+    Log records go to log_queue, for the parent process to write to its log file.
+    """
+    global _worker_converter
+    root_logger = logging.getLogger()
+    root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    root_logger.setLevel(logging.INFO)
+    _worker_converter = converter_class(source_dir, mysql_config, log_dir)
+
+
+def _process_database_in_worker(db_path: Path) -> Tuple[bool, Dict[str, int]]:
+    """Convert one database in a worker process and return its outcome and table statistics."""
+    _worker_converter.stats = dict.fromkeys(_worker_converter.stats, 0)
+    success = _worker_converter.process_database(db_path)
+    return success, _worker_converter.stats
+
+
 def main():
     """Main function to run the converter."""
     import argparse
@@ -802,6 +939,8 @@ def main():
     parser.add_argument("--user", required=True, help="MySQL username")
     parser.add_argument("--password", required=True, help="MySQL password")
     parser.add_argument("--log-dir", default="logs", help="Directory for log files (default: logs)")
+    parser.add_argument("--parallelism", type=int, default=1,
+                        help="Number of databases to convert in parallel worker processes (default: 1)")
     
     args = parser.parse_args()
     
@@ -815,7 +954,7 @@ def main():
     }
     
     # Create converter and run
-    converter = AccessToMySQLConverter(args.source_dir, mysql_config, args.log_dir)
+    converter = AccessToMySQLConverter(args.source_dir, mysql_config, args.log_dir, args.parallelism)
     report = converter.run_conversion()
     
     # Exit with appropriate code
@@ -11,7 +11,11 @@ Steps:
 
 import os
 import sys
+import csv
+import codecs
 import logging
+import logging.handlers
+import multiprocessing
 from pathlib import Path
 from datetime import datetime
 import re
@@ -19,25 +23,138 @@ import re
 try:
     import pandas as pd
     import mysql.connector
+    from mysql.connector import pooling
 except ImportError as e:
     print(f"Missing required package: {e}")
     print("pip install pandas mysql-connector-python")
     sys.exit(1)
 
+try:
+    from charset_normalizer import from_bytes as detect_charset
+except ImportError:
+    detect_charset = None  # Optional: fall back to trying encodings in turn
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:
+    pacsv = None  # Optional: only needed for the pyarrow CSV engine
+
+from mysql_bulk_load import (INNODB_ROW_SIZE_LIMIT, insert_rows, load_data_local_infile, qualified_table_name,
+                             quote_identifier, sanitize_identifier)
+
+
+# Encodings tried in turn when reading a CSV file
+CSV_ENCODINGS = ['utf-8', 'latin-1', 'cp1252', 'utf-16']
+
+# Bytes sampled from the start of a CSV file to detect its encoding
+ENCODING_SAMPLE_SIZE = 1 << 20
+
+# Canonical Python codec name -> MySQL character set for LOAD DATA
+# (UTF-16 files are not supported by it)
+LOAD_DATA_CHARSETS = {
+    'utf-8': 'utf8mb4',
+    'utf-8-sig': 'utf8mb4',
+    'ascii': 'utf8mb4',
+    'iso8859-1': 'latin1',
+    'cp1252': 'latin1',  # MySQL's latin1 is actually cp1252
+}
+
+# Bytes read from the start of a CSV file to detect its dialect
+DIALECT_SAMPLE_SIZE = 8192
+
+# Integer display widths reported by MySQL 5.7 (INT(11)) but not by 8.0 or by infer_mysql_type
+_INT_WIDTH_RE = re.compile(r'^((?:tiny|small|medium|big)?int)\(\d+\)')
+
+# Rows per chunk when streaming CSV files
+CSV_CHUNK_SIZE = 50000
+
+# Bytes per block for the pyarrow CSV engine; pyarrow fixes column types from the
+# first block, and later blocks that do not fit are handled by widen_arrow_column
+ARROW_BLOCK_SIZE = 16 << 20
+
+# A pyarrow error for a value that does not fit the type inferred from the first block
+_ARROW_CONVERSION_ERROR_RE = re.compile(
+    r"In CSV column #(\d+): (?:Row #\d+: )?CSV conversion error to ([^:]+): invalid value '(.*)'", re.S)
+
+# pyarrow column types tried, narrowest first, when a later block does not fit
+ARROW_WIDENING_ORDER = ['null', 'int64', 'double', 'string']
+
+# Bytes each inferred type counts against INNODB_ROW_SIZE_LIMIT
+# (VARCHAR(n) counts 4 bytes per character under utf8mb4; TEXT is stored off-page)
+COLUMN_ROW_BYTES = {
+    'TINYINT': 1,
+    'SMALLINT': 2,
+    'INT': 4,
+    'BIGINT': 8,
+    'DOUBLE': 8,
+    'DATETIME': 8,
+    'TEXT': 12,
+}
+
+# Session-scoped tuning applied to every borrowed connection; it ends with the session,
+# so other workloads on the server are unaffected (the pool resets sessions on return)
+BULK_LOAD_SESSION_VARS = {
+    'bulk_insert_buffer_size': 256 << 20,
+    'innodb_lock_wait_timeout': 600,
+}
+
+# Integer types chosen by infer_mysql_type, narrowest first
+INT_TYPES = ['TINYINT', 'SMALLINT', 'INT', 'BIGINT']
+
+
+def _is_decode_error(exc: Exception) -> bool:
+    """Tell whether an error from a CSV reader means the file was read with the wrong encoding."""
+    # Transcoding errors (pandas, and pyarrow for non-UTF-8 encodings) are UnicodeErrors
+    if isinstance(exc, UnicodeError):
+        return True
+    # pyarrow reports bad UTF-8 in a string column as ArrowInvalid, like any parse error
+    return pacsv is not None and isinstance(exc, pa.ArrowInvalid) and 'invalid UTF8' in str(exc)
+
+
+def _merge_mysql_types(a: str, b: str) -> str:
+    """Return the narrowest type infer_mysql_type can produce that holds values of both types."""
+    if a == b:
+        return a
+    if a in INT_TYPES and b in INT_TYPES:
+        return max(a, b, key=INT_TYPES.index)
+    if a in INT_TYPES + ['DOUBLE'] and b in INT_TYPES + ['DOUBLE']:
+        return 'DOUBLE'
+    if a.startswith('VARCHAR(') and b.startswith('VARCHAR('):
+        return max(a, b, key=lambda t: int(t[8:-1]))
+    # Text mixed with numbers or dates: the width of the numbers as text was never measured
+    return 'TEXT'
+
 
 class CSVToMySQLConverter:
     """Converts CSV files exported from Access to MySQL."""
     
-    def __init__(self, csv_dir: str, mysql_config: dict, database_name: str = None):
+    def __init__(self, csv_dir: str, mysql_config: dict, database_name: str = None, parallelism: int = 1,
+                 csv_engine: str = 'pandas'):
         self.csv_dir = Path(csv_dir)
         self.mysql_config = mysql_config
         self.database_name = database_name or self.sanitize_name(self.csv_dir.name)
+        self.parallelism = parallelism
+        self.csv_engine = csv_engine
+        
+        # MySQL connection pool, created on first use
+        self.mysql_pool = None
         
         # Setup logging
         self.setup_logging()
+        
+        if self.csv_engine == 'pyarrow' and pacsv is None:
+            self.logger.warning("pyarrow is not installed, using the pandas CSV engine")
+            self.csv_engine = 'pandas'
     
     def setup_logging(self):
         """Setup logging."""
+        self.logger = logging.getLogger(__name__)
+        if logging.getLogger().handlers:
+            # Already set up, e.g. in a worker process sending its records to the
+            # parent's handlers (see _init_csv_worker); log there, not to a new file
+            return
+        
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_file = f"csv_to_mysql_{timestamp}.log"
         
@@ -49,51 +166,127 @@ class CSVToMySQLConverter:
                 logging.StreamHandler(sys.stdout)
             ]
         )
-        self.logger = logging.getLogger(__name__)
     
     def sanitize_name(self, name: str) -> str:
         """Sanitize names for MySQL."""
-        sanitized = re.sub(r'[^\w]', '_', name)
-        if sanitized[0].isdigit():
-            sanitized = f"db_{sanitized}"
-        return sanitized.lower()[:64]
+        return sanitize_identifier(name)
+    
+    def quoted_table_name(self, table_name: str) -> str:
+        """Quote a table of the target database as `database`.`table`."""
+        return qualified_table_name(self.database_name, table_name)
+    
+    def table_schema_matches(self, cursor, table_name: str, columns: list) -> bool:
+        """Check whether an existing table has exactly the given (name, type, not_null) columns, in order."""
+        cursor.execute(
+            "SELECT column_name, column_type, is_nullable FROM information_schema.columns "
+            "WHERE table_schema = %s AND table_name = %s ORDER BY ordinal_position",
+            (self.database_name, table_name)
+        )
+        existing = [(name, _INT_WIDTH_RE.sub(r'\1', col_type.lower()), is_nullable == 'NO')
+                    for name, col_type, is_nullable in cursor.fetchall()]
+        return existing == [(name, col_type.lower(), not_null) for name, col_type, not_null in columns]
+    
+    def connect_to_mysql(self):
+        """Borrow a MySQL connection from the pool; close() returns it to the pool."""
+        if self.mysql_pool is None:
+            if not getattr(mysql.connector, 'HAVE_CEXT', False):
+                self.logger.warning("mysql-connector C extension not available, "
+                                    "using the slower pure-Python protocol")
+            self.mysql_pool = pooling.MySQLConnectionPool(
+                pool_name="csv_to_mysql",
+                pool_size=min(32, max(1, self.parallelism) * 2),
+                # Prefer the C extension (an explicit use_pure in the config still wins);
+                # local infile is needed for LOAD DATA LOCAL INFILE
+                **{'use_pure': False, **self.mysql_config, 'allow_local_infile': True}
+            )
+        conn = self.mysql_pool.get_connection()
+        try:
+            cursor = conn.cursor()
+            for name, value in BULK_LOAD_SESSION_VARS.items():
+                cursor.execute(f"SET SESSION {name} = %s", (value,))
+            cursor.close()
+        except Exception:
+            # Hand the connection back, or the pool runs dry
+            conn.close()
+            raise
+        return conn
+    
+    def detect_dialect(self, file_path: Path, encoding: str = 'utf-8'):
+        """Detect the CSV dialect (delimiter, quote character) from a bounded sample."""
+        with open(file_path, 'rb') as f:
+            raw = f.read(DIALECT_SAMPLE_SIZE)
+        sample = raw.decode(encoding, errors='replace')
+        
+        # Drop a partial last line so it does not skew the detection
+        if len(raw) == DIALECT_SAMPLE_SIZE and '\n' in sample:
+            sample = sample[:sample.rindex('\n')]
+        
+        try:
+            return csv.Sniffer().sniff(sample, delimiters=',;\t|')
+        except csv.Error:
+            # Fall back to comparing tabs and commas in the header line
+            first_line = sample.split('\n', 1)[0]
+            if first_line.count('\t') > first_line.count(','):
+                return csv.excel_tab
+            return csv.excel
+    
+    def detect_encoding(self, file_path: Path):
+        """Detect the file encoding from a bounded sample, or None if unknown."""
+        if detect_charset is None:
+            return None
+        
+        with open(file_path, 'rb') as f:
+            sample = f.read(ENCODING_SAMPLE_SIZE)
+        # Cut at a line break so a multi-byte character is not split
+        if len(sample) == ENCODING_SAMPLE_SIZE and b'\n' in sample:
+            sample = sample[:sample.rindex(b'\n') + 1]
+        
+        best = detect_charset(sample).best()
+        if best is None:
+            return None
+        return codecs.lookup(best.encoding).name
     
     def detect_delimiter(self, file_path: Path) -> str:
         """Detect CSV delimiter."""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            first_line = f.readline()
-            
-        if first_line.count('\t') > first_line.count(','):
-            return '\t'
-        return ','
+        return self.detect_dialect(file_path).delimiter
     
     def infer_mysql_type(self, series) -> str:
         """Infer MySQL type from pandas series."""
-        dtype = str(series.dtype)
+        types = pd.api.types
         
-        # Check for integers
-        if 'int' in dtype:
-            max_val = series.max() if not series.empty else 0
-            if max_val < 128:
+        # Check for integers; negative values need the same range as positive ones
+        if types.is_integer_dtype(series):
+            values = series.to_numpy()
+            min_val, max_val = (values.min(), values.max()) if len(values) else (0, 0)
+            if -128 <= min_val and max_val < 128:
                 return 'TINYINT'
-            elif max_val < 32768:
+            elif -32768 <= min_val and max_val < 32768:
                 return 'SMALLINT'
-            elif max_val < 2147483648:
+            elif -2147483648 <= min_val and max_val < 2147483648:
                 return 'INT'
             else:
                 return 'BIGINT'
         
         # Check for floats
-        if 'float' in dtype:
+        if types.is_float_dtype(series):
             return 'DOUBLE'
         
         # Check for dates
-        if 'datetime' in dtype:
+        if types.is_datetime64_any_dtype(series):
             return 'DATETIME'
         
-        # Check string length
-        if dtype == 'object':
-            max_len = series.astype(str).str.len().max() if not series.empty else 50
+        # Check string length; read_csv object columns normally hold only str and NaN,
+        # so the lengths can be taken without casting every value to str first
+        if types.is_object_dtype(series) or types.is_string_dtype(series):
+            try:
+                lengths = series.str.len()
+            except AttributeError:
+                # Non-string objects, e.g. booleans mixed with missing values
+                lengths = series.astype(str).str.len()
+            max_len = lengths.max() if not series.empty else 50
+            if pd.isna(max_len):
+                max_len = 50
+            max_len = int(max_len)
             if max_len <= 255:
                 return f'VARCHAR({min(max_len + 50, 255)})'
             else:
@@ -101,88 +294,328 @@ class CSVToMySQLConverter:
         
         return 'TEXT'
     
+    def profile_columns(self, chunks):
+        """Infer (name, type, not_null) for every column from all DataFrame chunks of a file.
+        
+        Each chunk is typed with infer_mysql_type and the results are merged, so a
+        longer string, a wider integer or text in a numeric column anywhere in the
+        file widens the column. NOT NULL is only emitted for columns with no missing
+        value in any chunk. VARCHARs are then widened to TEXT, largest first, until
+        the row fits InnoDB's row size limit. Returns None if there are no data rows.
+        """
+        names = types = has_null = None
+        for df in chunks:
+            if df.empty:
+                continue
+            if names is None:
+                names = list(df.columns)
+                types = [None] * len(names)
+                has_null = [False] * len(names)
+                # Kept for columns that turn out to be empty in every chunk
+                empty_types = [self.infer_mysql_type(df.iloc[:, i]) for i in range(len(names))]
+            
+            # Missing values are found for all columns in one vectorised pass
+            nulls = df.isna()
+            any_null = nulls.any().to_numpy()
+            all_null = nulls.all().to_numpy()
+            for i in range(len(names)):
+                has_null[i] = has_null[i] or bool(any_null[i])
+                if all_null[i]:
+                    continue
+                chunk_type = self.infer_mysql_type(df.iloc[:, i])
+                types[i] = chunk_type if types[i] is None else _merge_mysql_types(types[i], chunk_type)
+        
+        if names is None:
+            return None
+        types = [mysql_type or empty_type for mysql_type, empty_type in zip(types, empty_types)]
+        
+        def row_bytes(mysql_type):
+            if mysql_type.startswith('VARCHAR('):
+                return int(mysql_type[8:-1]) * 4 + 2
+            return COLUMN_ROW_BYTES.get(mysql_type, 12)
+        
+        sizes = [row_bytes(mysql_type) for mysql_type in types]
+        total = sum(sizes)
+        if total > INNODB_ROW_SIZE_LIMIT:
+            varchars = sorted((i for i, t in enumerate(types) if t.startswith('VARCHAR(')),
+                              key=lambda i: sizes[i], reverse=True)
+            for i in varchars:
+                if total <= INNODB_ROW_SIZE_LIMIT:
+                    break
+                total -= sizes[i] - COLUMN_ROW_BYTES['TEXT']
+                types[i] = 'TEXT'
+            self.logger.info("Row too wide for InnoDB, stored the widest VARCHAR columns as TEXT")
+        
+        return [(col, mysql_type, not null) for col, mysql_type, null in zip(names, types, has_null)]
+    
+    def widen_arrow_column(self, error, header: list, arrow_types: dict) -> bool:
+        """Widen the column named by a pyarrow conversion error, for the next read of the file.
+        
+        pyarrow fixes column types from the first block and fails on a later value
+        that does not fit. The column becomes the narrowest type in
+        ARROW_WIDENING_ORDER, above the one that failed, that holds the value.
+        Returns False if the error is not such a conversion error.
+        """
+        match = _ARROW_CONVERSION_ERROR_RE.search(str(error))
+        if match is None or int(match[1]) >= len(header):
+            return False
+        name, failed_type, value = header[int(match[1])], match[2], match[3]
+        failed_type = arrow_types.get(name, failed_type)
+        if failed_type == 'string':
+            return False
+        
+        parsers = {'int64': int, 'double': float}
+        start = ARROW_WIDENING_ORDER.index(failed_type) + 1 if failed_type in ARROW_WIDENING_ORDER else 3
+        for arrow_type in ARROW_WIDENING_ORDER[start:]:
+            if arrow_type in parsers:
+                try:
+                    parsers[arrow_type](value)
+                except ValueError:
+                    continue
+            break
+        arrow_types[name] = arrow_type
+        self.logger.info(f"Column {name} does not fit {failed_type} further down the file, reading it as {arrow_type}")
+        return True
+    
+    def profile_csv_file(self, csv_file: Path, dialect, encoding: str):
+        """Read a CSV file once, end to end, and infer its columns before anything is created.
+        
+        Returns (columns, arrow_types): the (name, type, not_null) triples from
+        profile_columns with sanitized names, or None if the file has no data rows,
+        and the pyarrow column types to read the file with again (empty for the
+        other engines).
+        """
+        arrow_types = {}
+        while True:
+            reader = self.open_csv_reader(csv_file, dialect, encoding, arrow_types)
+            try:
+                columns = self.profile_columns(reader)
+                break
+            except Exception as e:
+                # Re-read with the offending column widened; each retry widens one column
+                if self.csv_engine != 'pyarrow' or not isinstance(e, pa.ArrowInvalid):
+                    raise
+                with open(csv_file, encoding=encoding, newline='') as f:
+                    header = next(csv.reader(f, delimiter=dialect.delimiter, quotechar=dialect.quotechar), [])
+                if not self.widen_arrow_column(e, header, arrow_types):
+                    raise
+            finally:
+                reader.close()
+        
+        if columns is None:
+            return None, arrow_types
+        self.logger.info(f"Profiled {csv_file.name} with {encoding} encoding")
+        return [(self.sanitize_name(col), mysql_type, not_null) for col, mysql_type, not_null in columns], arrow_types
+    
+    def begin_bulk_load(self, cursor, table_name: str):
+        """Skip per-row constraint checks and index maintenance during a bulk load."""
+        cursor.execute("SET SESSION unique_checks=0")
+        cursor.execute("SET SESSION foreign_key_checks=0")
+        # Non-unique indexes are rebuilt in one pass by ENABLE KEYS (no-op for InnoDB)
+        cursor.execute(f"ALTER TABLE {self.quoted_table_name(table_name)} DISABLE KEYS")
+    
+    def end_bulk_load(self, cursor, table_name: str):
+        """Rebuild indexes and restore the checks disabled by begin_bulk_load."""
+        cursor.execute(f"ALTER TABLE {self.quoted_table_name(table_name)} ENABLE KEYS")
+        cursor.execute("SET SESSION unique_checks=1")
+        cursor.execute("SET SESSION foreign_key_checks=1")
+    
+    def load_data_infile(self, cursor, csv_file: Path, table_name: str, columns: list,
+                         delimiter: str, quotechar: str, encoding: str):
+        """Load a CSV file into an existing table with LOAD DATA LOCAL INFILE.
+        
+        Returns None without touching the table if the encoding cannot be loaded
+        this way (LOAD DATA does not accept UTF-16 files). Otherwise see
+        load_data_local_infile: None also means the load must be rolled back.
+        """
+        charset = LOAD_DATA_CHARSETS.get(codecs.lookup(encoding).name)
+        if charset is None:
+            return None
+        return load_data_local_infile(cursor, csv_file, self.database_name, table_name, columns,
+                                      charset, delimiter, quotechar)
+    
+    def insert_dataframe(self, conn, df, table_name: str) -> int:
+        """Insert a DataFrame into an existing table. Does not commit."""
+        # Convert NaN to None once for the whole chunk, in an object array so float
+        # columns can hold None, without building a second DataFrame
+        values = df.to_numpy(dtype=object)
+        values[df.isna().to_numpy()] = None
+        return insert_rows(conn, map(tuple, values.tolist()), self.database_name, table_name, list(df.columns))
+    
+    def iter_csv_rows(self, csv_file: Path, dialect, encoding: str, column_count: int):
+        """Stream data rows with the stdlib csv module, skipping the header.
+        
+        Empty fields become NULL, as with LOAD DATA, and ragged rows are padded or
+        cut to the table's width.
+        """
+        with open(csv_file, encoding=encoding, newline='') as f:
+            reader = csv.reader(f, delimiter=dialect.delimiter, quotechar=dialect.quotechar)
+            next(reader, None)
+            for row in reader:
+                if not row:
+                    continue
+                if len(row) != column_count:
+                    row = (row + [''] * column_count)[:column_count]
+                yield tuple([val if val != '' else None for val in row])
+    
+    def open_csv_reader(self, csv_file: Path, dialect, encoding: str, arrow_types: dict = None):
+        """Open a CSV file as an iterator of DataFrame chunks with the configured engine.
+        
+        arrow_types maps column names to the pyarrow types to read them as, overriding
+        the types pyarrow infers from the first block.
+        """
+        if self.csv_engine == 'pyarrow':
+            return self.iter_arrow_chunks(csv_file, dialect, encoding, arrow_types or {})
+        return pd.read_csv(csv_file, delimiter=dialect.delimiter, quotechar=dialect.quotechar,
+                           encoding=encoding, chunksize=CSV_CHUNK_SIZE)
+    
+    def iter_arrow_chunks(self, csv_file: Path, dialect, encoding: str, arrow_types: dict):
+        """Yield DataFrame chunks parsed by pyarrow's multi-threaded streaming CSV reader."""
+        reader = pacsv.open_csv(
+            csv_file,
+            read_options=pacsv.ReadOptions(encoding=encoding, block_size=ARROW_BLOCK_SIZE, use_threads=True),
+            parse_options=pacsv.ParseOptions(delimiter=dialect.delimiter, quote_char=dialect.quotechar),
+            # Empty strings are NULL, as with LOAD DATA and pandas
+            convert_options=pacsv.ConvertOptions(
+                column_types={name: pa.type_for_alias(t) for name, t in arrow_types.items()},
+                strings_can_be_null=True,
+            ),
+        )
+        for batch in reader:
+            yield batch.to_pandas()
+    
     def convert_csv_file(self, csv_file: Path) -> bool:
         """Convert a single CSV file to MySQL table."""
+        conn = None
         try:
             table_name = self.sanitize_name(csv_file.stem)
             self.logger.info(f"Converting {csv_file.name} -> {table_name}")
             
-            # Detect delimiter
-            delimiter = self.detect_delimiter(csv_file)
+            # Detect encoding, delimiter and quote character
+            detected_encoding = self.detect_encoding(csv_file)
+            dialect = self.detect_dialect(csv_file, detected_encoding or 'utf-8')
             
-            # Read CSV with multiple encoding attempts
-            encodings = ['utf-8', 'latin-1', 'cp1252', 'utf-16']
-            df = None
+            # Try the detected encoding first, then the usual ones. A decode error
+            # anywhere in the file, not just in the first chunk, moves on to the next.
+            encodings = list(CSV_ENCODINGS)
+            if detected_encoding:
+                encodings.insert(0, detected_encoding)
             
+            conn = self.connect_to_mysql()
             for encoding in encodings:
                 try:
-                    df = pd.read_csv(csv_file, delimiter=delimiter, encoding=encoding, low_memory=False)
-                    self.logger.info(f"Successfully read with {encoding} encoding")
-                    break
-                except UnicodeDecodeError:
+                    total_rows = self.load_csv_file(conn, csv_file, table_name, dialect, encoding)
+                except Exception as e:
+                    if not _is_decode_error(e):
+                        raise
+                    self.logger.info(f"Could not decode {csv_file.name} as {encoding}: {e}")
                     continue
-            
-            if df is None:
+                break
+            else:
                 self.logger.error(f"Could not read {csv_file} with any encoding")
                 return False
             
-            if df.empty:
+            if total_rows is None:
                 self.logger.warning(f"{csv_file.name} is empty")
-                return True
-            
-            # Clean column names
-            df.columns = [self.sanitize_name(col) for col in df.columns]
-            
-            # Connect to MySQL
-            conn = mysql.connector.connect(**self.mysql_config)
-            cursor = conn.cursor()
-            
-            # Create database
-            cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{self.database_name}`")
-            conn.commit()
-            
-            # Create table
-            columns_sql = []
-            for col in df.columns:
-                mysql_type = self.infer_mysql_type(df[col])
-                columns_sql.append(f"`{col}` {mysql_type}")
+            else:
+                self.logger.info(f"✅ Successfully converted {csv_file.name} ({total_rows} rows)")
+            return True
             
+        except Exception as e:
+            self.logger.error(f"❌ Failed to convert {csv_file.name}: {e}")
+            return False
+        finally:
+            # Always return the connection to the pool, which only holds a few
+            if conn is not None:
+                try:
+                    conn.close()
+                except Exception as e:
+                    self.logger.warning(f"Failed to return the MySQL connection to the pool: {e}")
+    
+    def load_csv_file(self, conn, csv_file: Path, table_name: str, dialect, encoding: str):
+        """Create the table for a CSV file and load the file into it, reading it as encoding.
+        
+        Returns the number of rows loaded, or None if the file has no data rows.
+        Decode errors are raised as they are, after rolling back, so the caller can
+        retry with another encoding; most surface while profiling, before any table
+        is touched.
+        """
+        # Type the columns from the whole file before touching the database
+        columns, arrow_types = self.profile_csv_file(csv_file, dialect, encoding)
+        if columns is None:
+            return None
+        column_names = [col for col, _, _ in columns]
+        
+        cursor = conn.cursor()
+        
+        # Create database
+        quoted_db = quote_identifier(self.database_name)
+        cursor.execute(f"CREATE DATABASE IF NOT EXISTS {quoted_db}")
+        conn.commit()
+        
+        # Create table, or just empty it when a previous run left the same schema
+        quoted_table = self.quoted_table_name(table_name)
+        if self.table_schema_matches(cursor, table_name, columns):
+            self.logger.info(f"Table {table_name} already has this schema, truncating")
+            cursor.execute(f"TRUNCATE TABLE {quoted_table}")
+        else:
+            columns_sql = [f"{quote_identifier(col)} {mysql_type}{' NOT NULL' if not_null else ''}"
+                           for col, mysql_type, not_null in columns]
             create_sql = f"""
-            CREATE TABLE `{self.database_name}`.`{table_name}` (
+            CREATE TABLE {quoted_table} (
                 {',\n    '.join(columns_sql)}
             ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
             """
-            
-            cursor.execute(f"DROP TABLE IF EXISTS `{self.database_name}`.`{table_name}`")
+            cursor.execute(f"DROP TABLE IF EXISTS {quoted_table}")
             cursor.execute(create_sql)
-            conn.commit()
-            
-            # Insert data
-            df = df.where(pd.notnull(df), None)
-            
-            columns = ', '.join([f"`{col}`" for col in df.columns])
-            placeholders = ', '.join(['%s'] * len(df.columns))
-            insert_sql = f"INSERT INTO `{self.database_name}`.`{table_name}` ({columns}) VALUES ({placeholders})"
-            
-            # Insert in batches
-            batch_size = 1000
-            total_rows = len(df)
+        conn.commit()
+        
+        self.begin_bulk_load(cursor, table_name)
+        try:
+            # Load the whole file in one transaction: a single redo-log flush on
+            # commit, and a failure part-way through rolls back cleanly
+            conn.start_transaction()
             
-            for i in range(0, total_rows, batch_size):
-                batch = df.iloc[i:i+batch_size]
-                values = [tuple(row) for row in batch.values]
-                cursor.executemany(insert_sql, values)
-                conn.commit()
-                
-                self.logger.info(f"Inserted batch {i//batch_size + 1} ({min(i+batch_size, total_rows)}/{total_rows} rows)")
+            # Stream the file straight to the server; fall back to INSERTs if the
+            # server (or the file's encoding) does not allow it
+            try:
+                total_rows = self.load_data_infile(cursor, csv_file, table_name, column_names,
+                                                   dialect.delimiter, dialect.quotechar, encoding)
+            except mysql.connector.Error as e:
+                self.logger.warning(f"LOAD DATA LOCAL INFILE failed, falling back to INSERT: {e}")
+                total_rows = None
             
-            conn.close()
-            self.logger.info(f"✅ Successfully converted {csv_file.name} ({total_rows} rows)")
-            return True
+            if total_rows is not None:
+                self.logger.info(f"Loaded {total_rows} rows with LOAD DATA LOCAL INFILE")
+            else:
+                # Undo whatever LOAD DATA did, then stream the file again as INSERTs
+                conn.rollback()
+                conn.start_transaction()
+                if self.csv_engine == 'csv':
+                    rows = self.iter_csv_rows(csv_file, dialect, encoding, len(column_names))
+                    total_rows = insert_rows(conn, rows, self.database_name, table_name, column_names)
+                else:
+                    total_rows = 0
+                    reader = self.open_csv_reader(csv_file, dialect, encoding, arrow_types)
+                    try:
+                        for chunk in reader:
+                            chunk.columns = column_names
+                            total_rows += self.insert_dataframe(conn, chunk, table_name)
+                    finally:
+                        reader.close()
             
-        except Exception as e:
-            self.logger.error(f"❌ Failed to convert {csv_file.name}: {e}")
-            return False
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            # Only log a failed cleanup, so it cannot replace the load's own error
+            try:
+                self.end_bulk_load(cursor, table_name)
+            except Exception as e:
+                self.logger.error(f"Failed to re-enable keys and checks on {table_name}: {e}")
+        
+        return total_rows
     
     def convert_all_csv_files(self):
         """Convert all CSV files in the directory."""
@@ -194,14 +627,54 @@ class CSVToMySQLConverter:
         
         self.logger.info(f"Found {len(csv_files)} CSV files to convert")
         
-        successful = 0
-        for csv_file in csv_files:
-            if self.convert_csv_file(csv_file):
-                successful += 1
+        workers = min(self.parallelism, len(csv_files))
+        if workers > 1:
+            # Each file is its own table; each worker process opens its own MySQL connections
+            self.logger.info(f"Converting with {workers} worker processes")
+            
+            # Workers send their log records here, and this process writes them to its own log
+            log_queue = multiprocessing.Queue()
+            log_listener = logging.handlers.QueueListener(log_queue, *logging.getLogger().handlers,
+                                                          respect_handler_level=True)
+            log_listener.start()
+            init_args = (str(self.csv_dir), self.mysql_config, self.database_name, self.csv_engine, log_queue)
+            try:
+                with multiprocessing.Pool(processes=workers, initializer=_init_csv_worker,
+                                          initargs=init_args) as pool:
+                    results = pool.map(_convert_csv_in_worker, csv_files)
+                    # Let the workers exit on their own, so their last records reach the queue
+                    pool.close()
+                    pool.join()
+            finally:
+                log_listener.stop()
+        else:
+            results = [self.convert_csv_file(csv_file) for csv_file in csv_files]
         
+        successful = sum(results)
         self.logger.info(f"Conversion completed: {successful}/{len(csv_files)} files successful")
 
 
+# Converter instance owned by a worker process (see convert_all_csv_files)
+_worker_converter = None
+
+
+def _init_csv_worker(csv_dir: str, mysql_config: dict, database_name: str, csv_engine: str, log_queue):
+    """Build one converter per worker process; connections are never shared across processes.
+    
+    Log records go to log_queue, for the parent process to write to its log file.
+    """
+    global _worker_converter
+    root_logger = logging.getLogger()
+    root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    root_logger.setLevel(logging.INFO)
+    _worker_converter = CSVToMySQLConverter(csv_dir, mysql_config, database_name, csv_engine=csv_engine)
+
+
+def _convert_csv_in_worker(csv_file: Path) -> bool:
+    """Convert one CSV file in a worker process."""
+    return _worker_converter.convert_csv_file(csv_file)
+
+
 def main():
     """Main function."""
     import argparse
@@ -217,6 +690,11 @@ def main():
     parser.add_argument("--port", type=int, default=3306, help="MySQL port")
     parser.add_argument("--user", required=True, help="MySQL username")
     parser.add_argument("--password", required=True, help="MySQL password")
+    parser.add_argument("--parallelism", type=int, default=1,
+                        help="Number of CSV files to convert in parallel worker processes (default: 1)")
+    parser.add_argument("--csv-engine", choices=['pandas', 'pyarrow', 'csv'], default='pandas',
+                        help="CSV parser; pyarrow is multi-threaded but must be installed, csv streams "
+                             "INSERT fallback rows with the stdlib reader (default: pandas)")
     
     args = parser.parse_args()
     
@@ -228,7 +706,8 @@ def main():
         'autocommit': False
     }
     
-    converter = CSVToMySQLConverter(args.csv_dir, mysql_config, args.database_name)
+    converter = CSVToMySQLConverter(args.csv_dir, mysql_config, args.database_name, args.parallelism,
+                                    args.csv_engine)
     converter.convert_all_csv_files()
 
 
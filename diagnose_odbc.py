@@ -4,9 +4,17 @@ Diagnostic script for MS Access ODBC connection issues.
 This script helps identify and resolve common ODBC driver problems.
 """
 
+import io
+import os
 import sys
+import json
+import time
+import argparse
 import platform
-import subprocess
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import redirect_stdout
+from itertools import islice
 from pathlib import Path
 
 try:
@@ -15,6 +23,107 @@ except ImportError:
     print("Error: pyodbc is not installed. Run: pip install pyodbc")
     sys.exit(1)
 
+# pyodbc.drivers() enumerates the ODBC registry, so it is read once per run
+_DRIVERS_CACHE = None
+
+# Substrings that mark an ODBC driver name as Access-related
+ACCESS_DRIVER_TOKENS = ('access', 'mdb', 'accdb')
+
+# Only the driver varies between connection attempts to the same database
+ACCESS_CONN_STR_TEMPLATE = "DRIVER={{{driver}}};DBQ={dbq};ExtendedAnsiSQL=1;"
+
+# Driver and registry results are reused across runs for this many seconds; 32-bit
+# and 64-bit Python see different drivers, so each bitness has its own cache file
+# (see _diag_cache_path)
+DIAG_CACHE_TTL = 1800
+
+
+def _get_drivers():
+    """Return the installed ODBC drivers, enumerating them only on first use."""
+    global _DRIVERS_CACHE
+    if _DRIVERS_CACHE is None:
+        _DRIVERS_CACHE = pyodbc.drivers()
+    return _DRIVERS_CACHE
+
+
+def _is_access_driver(driver):
+    """Check whether an ODBC driver name refers to Microsoft Access."""
+    name = driver.lower()
+    return any(token in name for token in ACCESS_DRIVER_TOKENS)
+
+
+def _diag_cache_path():
+    """Return this Python bitness's cache file.
+    
+    Built on use, not at import: platform.architecture() runs the `file` command
+    on non-Windows systems.
+    """
+    return Path(tempfile.gettempdir()) / f"msaccess_odbc_diag_{platform.architecture()[0]}.json"
+
+
+def _load_diag_cache():
+    """Return the cached driver/registry results if they are fresh enough, else None."""
+    cache_path = _diag_cache_path()
+    try:
+        if time.time() - cache_path.stat().st_mtime >= DIAG_CACHE_TTL:
+            return None
+        with open(cache_path, encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or 'drivers' not in data or 'access_engine' not in data:
+        return None
+    return data
+
+
+def _save_diag_cache(drivers_result, engines_result):
+    """Write driver/registry results to the cache file atomically."""
+    data = {
+        'drivers': {k: v for k, v in drivers_result.items() if k != 'error'},
+        'access_engine': engines_result,
+        'timestamp': time.time(),
+    }
+    cache_path = _diag_cache_path()
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def _get_driver_bitness():
+    """Map each installed ODBC driver to '64bit' or '32bit' when it is installed
+    for only one architecture; drivers installed for both are left out.
+    
+    Reads the 64-bit and 32-bit views of ODBCINST.INI in one pass each.
+    """
+    if platform.system() != "Windows":
+        return {}
+    try:
+        import winreg
+    except ImportError:
+        return {}
+    
+    installed = {}
+    for bits, view in (('64bit', winreg.KEY_WOW64_64KEY), ('32bit', winreg.KEY_WOW64_32KEY)):
+        names = set()
+        try:
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\ODBC\ODBCINST.INI\ODBC Drivers",
+                                0, winreg.KEY_READ | view) as key:
+                for i in range(winreg.QueryInfoKey(key)[1]):
+                    names.add(winreg.EnumValue(key, i)[0])
+        except OSError:
+            pass
+        installed[bits] = names
+    
+    bitness = {}
+    for bits, other in (('64bit', '32bit'), ('32bit', '64bit')):
+        for name in installed[bits] - installed[other]:
+            bitness[name] = bits
+    return bitness
+
 
 def check_python_architecture():
     """Check if Python is 32-bit or 64-bit."""
@@ -23,41 +132,64 @@ def check_python_architecture():
     return arch
 
 
-def list_odbc_drivers():
-    """List all available ODBC drivers."""
+def find_odbc_drivers():
+    """Enumerate ODBC drivers and split them into Access-related and other drivers."""
     try:
-        drivers = pyodbc.drivers()
-        print(f"\nAvailable ODBC Drivers ({len(drivers)} total):")
-        print("-" * 50)
-        
-        access_drivers = []
-        other_drivers = []
-        
-        for driver in sorted(drivers):
-            if 'access' in driver.lower() or 'mdb' in driver.lower() or 'accdb' in driver.lower():
-                access_drivers.append(driver)
-                print(f"✅ {driver} (Access-related)")
-            else:
-                other_drivers.append(driver)
-        
-        if not access_drivers:
-            print("❌ No Microsoft Access drivers found!")
-        
-        print(f"\nOther drivers ({len(other_drivers)}):")
-        for driver in other_drivers[:10]:  # Show first 10 to avoid clutter
-            print(f"   {driver}")
-        if len(other_drivers) > 10:
-            print(f"   ... and {len(other_drivers) - 10} more")
-        
-        return access_drivers
-        
+        drivers = sorted(_get_drivers())
     except Exception as e:
-        print(f"Error listing drivers: {e}")
+        return {'drivers': [], 'access_drivers': [], 'other_drivers': [], 'error': e}
+    
+    access_drivers = []
+    other_drivers = []
+    for driver in drivers:
+        if _is_access_driver(driver):
+            access_drivers.append(driver)
+        else:
+            other_drivers.append(driver)
+    return {'drivers': drivers, 'access_drivers': access_drivers,
+            'other_drivers': other_drivers, 'error': None}
+
+
+def list_odbc_drivers(result=None):
+    """List all available ODBC drivers.
+    
+    result is a find_odbc_drivers() result to print; drivers are enumerated
+    when it is not given.
+    """
+    if result is None:
+        result = find_odbc_drivers()
+    
+    if result['error'] is not None:
+        print(f"Error listing drivers: {result['error']}")
         return []
+    
+    access_drivers = result['access_drivers']
+    other_drivers = result['other_drivers']
+    
+    print(f"\nAvailable ODBC Drivers ({len(result['drivers'])} total):")
+    print("-" * 50)
+    
+    for driver in access_drivers:
+        print(f"✅ {driver} (Access-related)")
+    
+    if not access_drivers:
+        print("❌ No Microsoft Access drivers found!")
+    
+    print(f"\nOther drivers ({len(other_drivers)}):")
+    for driver in other_drivers[:10]:  # Show first 10 to avoid clutter
+        print(f"   {driver}")
+    if len(other_drivers) > 10:
+        print(f"   ... and {len(other_drivers) - 10} more")
+    
+    return access_drivers
 
 
-def test_access_connection(test_db_path=None):
-    """Test connection to an Access database."""
+def test_access_connection(test_db_path=None, access_drivers=None):
+    """Test connection to an Access database.
+    
+    access_drivers is the list returned by list_odbc_drivers; it is looked up
+    again only when not given.
+    """
     print(f"\nTesting Access Database Connection:")
     print("-" * 40)
     
@@ -70,87 +202,153 @@ def test_access_connection(test_db_path=None):
         print(f"Test database not found: {test_path}")
         return False
     
-    access_drivers = [d for d in pyodbc.drivers() if 'access' in d.lower() or 'mdb' in d.lower()]
+    if access_drivers is None:
+        access_drivers = [d for d in _get_drivers() if _is_access_driver(d)]
     
     if not access_drivers:
         print("❌ No Access drivers available for testing")
         return False
     
+    # A driver built for the other architecture can only fail (or time out), so skip it
+    python_bits = platform.architecture()[0]
+    driver_bitness = _get_driver_bitness()
+    usable_drivers = []
     for driver in access_drivers:
-        try:
-            conn_str = f"DRIVER={{{driver}}};DBQ={test_path.absolute()};ExtendedAnsiSQL=1;"
+        bits = driver_bitness.get(driver)
+        if bits is not None and bits != python_bits:
+            print(f"⏭️  Skipping {driver}: installed as {bits} only, Python is {python_bits}")
+        else:
+            usable_drivers.append(driver)
+    access_drivers = usable_drivers
+    
+    if not access_drivers:
+        print("❌ No Access drivers match this Python's architecture")
+        return False
+    
+    # Probe all drivers at once so a hanging driver costs its own timeout,
+    # not the sum of every driver's; the first success wins
+    executor = ThreadPoolExecutor(max_workers=len(access_drivers))
+    try:
+        pending = set()
+        for driver in access_drivers:
             print(f"Testing with driver: {driver}")
-            
-            conn = pyodbc.connect(conn_str, timeout=10)
-            cursor = conn.cursor()
-            
-            # Try to list tables
-            tables = []
-            for table_info in cursor.tables(tableType='TABLE'):
-                if not table_info.table_name.startswith('MSys'):
-                    tables.append(table_info.table_name)
-            
-            conn.close()
-            print(f"✅ Connection successful! Found {len(tables)} tables")
-            if tables:
-                print(f"   Sample tables: {', '.join(tables[:3])}")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Connection failed with {driver}: {e}")
+            pending.add(executor.submit(_try_driver, driver, test_path.absolute()))
+        
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                driver, table_count, sample, error = future.result()
+                if error is not None:
+                    print(f"❌ Connection failed with {driver}: {error}")
+                    continue
+                
+                print(f"✅ Connection successful with {driver}! Found {table_count} tables")
+                if sample:
+                    print(f"   Sample tables: {', '.join(sample)}")
+                return True
+    finally:
+        # Stragglers keep running in the background; their results are ignored
+        executor.shutdown(wait=False, cancel_futures=True)
     
     return False
 
 
-def check_access_engine_installation():
-    """Check if Microsoft Access Database Engine is installed."""
-    print(f"\nChecking Microsoft Access Database Engine:")
-    print("-" * 50)
+def _try_driver(driver, db_path):
+    """Connect with one driver and count user tables.
     
+    Returns (driver, table_count, sample_tables, error); only the first three
+    table names are kept.
+    """
+    conn = None
+    try:
+        conn_str = ACCESS_CONN_STR_TEMPLATE.format_map({'driver': driver, 'dbq': db_path})
+        conn = pyodbc.connect(conn_str, timeout=3)
+        cursor = conn.cursor()
+        
+        # Try to list tables, streaming the catalog rather than building a list
+        names = (t.table_name for t in cursor.tables(tableType='TABLE')
+                 if not t.table_name.startswith('MSys'))
+        sample = list(islice(names, 3))
+        table_count = len(sample) + sum(1 for _ in names)
+        cursor.close()
+        return driver, table_count, sample, None
+    except Exception as e:
+        return driver, 0, [], e
+    finally:
+        if conn is not None:
+            conn.close()
+
+
+def find_access_engines():
+    """Scan the registry for Access Database Engine installations.
+    
+    Returns a dict whose 'status' is 'ok', 'no_winreg' or 'not_windows', with
+    the engines found under 'found_versions'.
+    """
     # Check registry for installed components (Windows specific)
-    if platform.system() == "Windows":
+    if platform.system() != "Windows":
+        return {'status': 'not_windows', 'found_versions': []}
+    
+    try:
+        import winreg
+    except ImportError:
+        return {'status': 'no_winreg', 'found_versions': []}
+    
+    # Check for Access Database Engine in registry; the 32-bit view of
+    # SOFTWARE\Microsoft\Office is the WOW6432Node key, and asking for each
+    # view explicitly finds 64-bit Office from 32-bit Python too
+    registry_paths = [
+        (r"SOFTWARE\Microsoft\Office\ClickToRun\REGISTRY\MACHINE\Software\Microsoft\Office",
+         winreg.KEY_WOW64_64KEY),
+        (r"SOFTWARE\Microsoft\Office", winreg.KEY_WOW64_64KEY),
+        (r"SOFTWARE\Microsoft\Office", winreg.KEY_WOW64_32KEY),
+    ]
+    
+    found_versions = []
+    for base_path, view in registry_paths:
+        access = winreg.KEY_READ | view
         try:
-            import winreg
-            
-            # Check for Access Database Engine in registry
-            registry_paths = [
-                r"SOFTWARE\Microsoft\Office\ClickToRun\REGISTRY\MACHINE\Software\Microsoft\Office",
-                r"SOFTWARE\Microsoft\Office",
-                r"SOFTWARE\WOW6432Node\Microsoft\Office"
-            ]
-            
-            found_versions = []
-            for base_path in registry_paths:
-                try:
-                    with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, base_path) as key:
-                        i = 0
-                        while True:
-                            try:
-                                subkey_name = winreg.EnumKey(key, i)
-                                if subkey_name.replace(".", "").isdigit():  # Version numbers like 16.0, 15.0
-                                    try:
-                                        subkey_path = f"{base_path}\\{subkey_name}\\Access Connectivity Engine"
-                                        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, subkey_path):
-                                            found_versions.append(f"Access Database Engine {subkey_name}")
-                                    except FileNotFoundError:
-                                        pass
-                                i += 1
-                            except OSError:
-                                break
-                except FileNotFoundError:
-                    continue
-            
-            if found_versions:
-                print("✅ Found Microsoft Access Database Engine installations:")
-                for version in found_versions:
-                    print(f"   - {version}")
-            else:
-                print("❌ Microsoft Access Database Engine not found in registry")
-                
-        except ImportError:
-            print("Cannot check registry (winreg not available)")
-    else:
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, base_path, 0, access) as key:
+                subkey_count = winreg.QueryInfoKey(key)[0]
+                for i in range(subkey_count):
+                    subkey_name = winreg.EnumKey(key, i)
+                    if not subkey_name.replace(".", "", 1).isdigit():  # Version numbers like 16.0, 15.0
+                        continue
+                    try:
+                        with winreg.OpenKey(key, f"{subkey_name}\\Access Connectivity Engine", 0, access):
+                            version = f"Access Database Engine {subkey_name}"
+                            if version not in found_versions:
+                                found_versions.append(version)
+                    except FileNotFoundError:
+                        pass
+        except OSError:
+            continue
+    
+    return {'status': 'ok', 'found_versions': found_versions}
+
+
+def check_access_engine_installation(result=None):
+    """Check if Microsoft Access Database Engine is installed.
+    
+    result is a find_access_engines() result to print; the registry is
+    scanned when it is not given.
+    """
+    if result is None:
+        result = find_access_engines()
+    
+    print(f"\nChecking Microsoft Access Database Engine:")
+    print("-" * 50)
+    
+    if result['status'] == 'not_windows':
         print("Registry check only available on Windows")
+    elif result['status'] == 'no_winreg':
+        print("Cannot check registry (winreg not available)")
+    elif result['found_versions']:
+        print("✅ Found Microsoft Access Database Engine installations:")
+        for version in result['found_versions']:
+            print(f"   - {version}")
+    else:
+        print("❌ Microsoft Access Database Engine not found in registry")
 
 
 def provide_solutions():
@@ -189,7 +387,7 @@ def provide_solutions():
     print("-" * 25)
     print("After installing the Access Database Engine:")
     print("   - Restart your command prompt/IDE")
-    print("   - Run this diagnostic script again")
+    print("   - Run this diagnostic script again with --no-cache")
     print("   - Test with a sample Access database")
     
     print(f"\n4. Alternative Solutions")
@@ -201,8 +399,67 @@ def provide_solutions():
     print("   - Use third-party tools like MDB Viewer Plus")
 
 
-def main():
+def collect_system_checks(use_cache=True):
+    """Run driver enumeration and the registry scan, or reuse a fresh cached run.
+    
+    Returns (find_odbc_drivers result, find_access_engines result).
+    """
+    if use_cache:
+        cached = _load_diag_cache()
+        if cached is not None:
+            return {**cached['drivers'], 'error': None}, cached['access_engine']
+    
+    # Driver enumeration and the registry scan are independent, so run them side by side
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        drivers_future = executor.submit(find_odbc_drivers)
+        engines_future = executor.submit(find_access_engines)
+        drivers_result = drivers_future.result()
+        engines_result = engines_future.result()
+    
+    # No Access driver is the state the user is about to fix, so never cache it
+    if drivers_result['error'] is None and drivers_result['access_drivers']:
+        _save_diag_cache(drivers_result, engines_result)
+    return drivers_result, engines_result
+
+
+def build_json_report(test_db=None, use_cache=True):
+    """Collect the diagnostic results as a JSON-serialisable dict."""
+    drivers_result, engines_result = collect_system_checks(use_cache)
+    report = {
+        'operating_system': f"{platform.system()} {platform.release()}",
+        'python_architecture': platform.architecture()[0],
+        'drivers': {**drivers_result, 'error': None if drivers_result['error'] is None
+                    else str(drivers_result['error'])},
+        'access_engine': engines_result,
+        'connection_test': None,
+    }
+    if test_db:
+        # The connection test reports as it goes; only its outcome goes into the report
+        with redirect_stdout(io.StringIO()):
+            success = test_access_connection(test_db, drivers_result['access_drivers'])
+        report['connection_test'] = {'database': test_db, 'success': success}
+    return report
+
+
+def main(argv=None):
     """Main diagnostic function."""
+    parser = argparse.ArgumentParser(description="Diagnose MS Access ODBC connection issues")
+    parser.add_argument("--test-db", metavar="PATH",
+                        help="Access database to test a connection with (skips the prompt)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"Ignore driver/registry results cached by a run in the last "
+                             f"{DIAG_CACHE_TTL // 60} minutes")
+    parser.add_argument("--json", action="store_true",
+                        help="Print a structured JSON report instead of the text report")
+    args = parser.parse_args(argv)
+    
+    if args.json:
+        print(json.dumps(build_json_report(args.test_db, use_cache=not args.no_cache), indent=2))
+        return
+    
+    # Prompts only make sense with someone at the keyboard
+    interactive = sys.stdin.isatty()
+    
     print("=" * 60)
     print("MS ACCESS ODBC DIAGNOSTIC TOOL")
     print("=" * 60)
@@ -211,16 +468,20 @@ def main():
     print(f"Operating System: {platform.system()} {platform.release()}")
     check_python_architecture()
     
+    drivers_result, engines_result = collect_system_checks(use_cache=not args.no_cache)
+    
     # Check ODBC drivers
-    access_drivers = list_odbc_drivers()
+    access_drivers = list_odbc_drivers(drivers_result)
     
     # Check Access Engine installation
-    check_access_engine_installation()
+    check_access_engine_installation(engines_result)
     
     # Test connection if user provides a database
-    test_db = input(f"\nEnter path to test Access database (optional, press Enter to skip): ").strip()
+    test_db = args.test_db
+    if test_db is None and interactive:
+        test_db = input(f"\nEnter path to test Access database (optional, press Enter to skip): ").strip()
     if test_db:
-        test_access_connection(test_db)
+        test_access_connection(test_db, access_drivers)
     
     # Provide solutions
     provide_solutions()
@@ -238,8 +499,10 @@ def main():
     
     print(f"\nFor more help, check the logs when running the converter")
     print("or visit: https://github.com/mkleehammer/pyodbc/wiki")
+    
+    if interactive:
+        input("\nPress Enter to exit...")
 
 
 if __name__ == "__main__":
     main()
-    input("\nPress Enter to exit...")
@@ -7,6 +7,15 @@ This demonstrates how to use the converter programmatically.
 from pathlib import Path
 from access_to_mysql_converter import AccessToMySQLConverter
 
+# (label, statistics key) pairs shown in the results summary, in order
+RESULT_FIELDS = [
+    ('Databases found', 'databases_found'),
+    ('Successfully converted', 'databases_converted'),
+    ('Failed', 'databases_failed'),
+    ('Tables converted', 'tables_converted'),
+    ('Records migrated', 'records_migrated'),
+]
+
 
 def example_usage():
     """Example of how to use the converter programmatically."""
@@ -35,17 +44,14 @@ def example_usage():
         
         # Process the results
         stats = report['statistics']
-        print(f"\nConversion Results:")
-        print(f"  Databases found: {stats['databases_found']}")
-        print(f"  Successfully converted: {stats['databases_converted']}")
-        print(f"  Failed: {stats['databases_failed']}")
-        print(f"  Tables converted: {stats['tables_converted']}")
-        print(f"  Records migrated: {stats['records_migrated']}")
+        print("\nConversion Results:\n" +
+              "\n".join(f"  {label}: {stats.get(key, 0)}" for label, key in RESULT_FIELDS))
         
-        if stats['databases_failed'] == 0:
+        databases_failed = stats.get('databases_failed', 0)
+        if databases_failed == 0:
             print("\n✅ All conversions completed successfully!")
         else:
-            print(f"\n⚠️ {stats['databases_failed']} databases failed to convert")
+            print(f"\n⚠️ {databases_failed} databases failed to convert")
             print("Check the log files for detailed error information.")
         
         return report
@@ -7,61 +7,249 @@ Run this if you encounter "database already open" errors during conversion.
 import os
 import sys
 import time
-import subprocess
+import ctypes
+import functools
+
+TH32CS_SNAPPROCESS = 0x00000002
+PROCESS_TERMINATE = 0x0001
+MAX_PATH = 260
+
+class PROCESSENTRY32W(ctypes.Structure):
+    """Toolhelp32 process entry (tlhelp32.h)."""
+    _fields_ = [
+        ('dwSize', ctypes.c_uint32),
+        ('cntUsage', ctypes.c_uint32),
+        ('th32ProcessID', ctypes.c_uint32),
+        ('th32DefaultHeapID', ctypes.c_size_t),
+        ('th32ModuleID', ctypes.c_uint32),
+        ('cntThreads', ctypes.c_uint32),
+        ('th32ParentProcessID', ctypes.c_uint32),
+        ('pcPriClassBase', ctypes.c_long),
+        ('dwFlags', ctypes.c_uint32),
+        ('szExeFile', ctypes.c_wchar * MAX_PATH),
+    ]
+
+def _kernel32():
+    """Load kernel32 with handle-returning signatures; raises OSError off Windows."""
+    try:
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    except AttributeError:
+        raise OSError("kernel32 is only available on Windows")
+    kernel32.CreateToolhelp32Snapshot.restype = ctypes.c_void_p
+    kernel32.CreateToolhelp32Snapshot.argtypes = [ctypes.c_uint32, ctypes.c_uint32]
+    kernel32.Process32FirstW.argtypes = [ctypes.c_void_p, ctypes.POINTER(PROCESSENTRY32W)]
+    kernel32.Process32NextW.argtypes = [ctypes.c_void_p, ctypes.POINTER(PROCESSENTRY32W)]
+    kernel32.OpenProcess.restype = ctypes.c_void_p
+    kernel32.OpenProcess.argtypes = [ctypes.c_uint32, ctypes.c_int, ctypes.c_uint32]
+    kernel32.TerminateProcess.argtypes = [ctypes.c_void_p, ctypes.c_uint]
+    kernel32.CloseHandle.argtypes = [ctypes.c_void_p]
+    return kernel32
+
+def find_processes(name):
+    """Return the PIDs of running processes whose executable is name (case-insensitive).
+    
+    Walks a Toolhelp32 snapshot in-process instead of spawning tasklist.exe.
+    Raises OSError where the API is unavailable.
+    """
+    kernel32 = _kernel32()
+    snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if snapshot is None or snapshot == ctypes.c_void_p(-1).value:
+        raise ctypes.WinError(ctypes.get_last_error())
+    
+    pids = []
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        name = name.lower()
+        more = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while more:
+            if entry.szExeFile.lower() == name:
+                pids.append(entry.th32ProcessID)
+            more = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+    finally:
+        kernel32.CloseHandle(snapshot)
+    return pids
+
+def terminate_processes(pids):
+    """Terminate the given processes; returns how many were terminated."""
+    kernel32 = _kernel32()
+    terminated = 0
+    for pid in pids:
+        handle = kernel32.OpenProcess(PROCESS_TERMINATE, False, pid)
+        if not handle:
+            continue
+        try:
+            if kernel32.TerminateProcess(handle, 1):
+                terminated += 1
+        finally:
+            kernel32.CloseHandle(handle)
+    return terminated
+
+def run_hidden(args, timeout=2.0):
+    """Run a console tool without opening a console window, giving up after timeout.
+    
+    Raises subprocess.TimeoutExpired if the tool hangs.
+    """
+    import subprocess
+    kwargs = {}
+    if os.name == 'nt':
+        # No console allocation (and no conhost.exe); the hidden window is for
+        # older Windows versions that ignore CREATE_NO_WINDOW
+        startupinfo = subprocess.STARTUPINFO()
+        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        startupinfo.wShowWindow = subprocess.SW_HIDE
+        kwargs = {'creationflags': subprocess.CREATE_NO_WINDOW, 'startupinfo': startupinfo}
+    return subprocess.run(args, capture_output=True, text=True, timeout=timeout, **kwargs)
 
 def kill_access_processes():
     """Kill any running Microsoft Access processes."""
     print("🔍 Checking for running Microsoft Access processes...")
     
     try:
-        # Kill MSACCESS.EXE processes
-        result = subprocess.run(['taskkill', '/F', '/IM', 'MSACCESS.EXE'], 
-                              capture_output=True, text=True)
-        if result.returncode == 0:
+        pids = find_processes('MSACCESS.EXE')
+    except OSError:
+        pids = None
+    
+    if pids is None:
+        # Toolhelp API unavailable - fall back to taskkill
+        import subprocess
+        try:
+            result = run_hidden(['taskkill', '/F', '/IM', 'MSACCESS.EXE'])
+            if result.returncode == 0:
+                print("✅ Killed Microsoft Access processes")
+            else:
+                print("ℹ️  No Microsoft Access processes found")
+        except subprocess.TimeoutExpired:
+            print("⚠️  Could not kill Access processes: taskkill timed out")
+        except Exception as e:
+            print(f"⚠️  Could not kill Access processes: {e}")
+        return
+    
+    if not pids:
+        print("ℹ️  No Microsoft Access processes found")
+        return
+    
+    try:
+        terminated = terminate_processes(pids)
+        if terminated == len(pids):
             print("✅ Killed Microsoft Access processes")
         else:
-            print("ℹ️  No Microsoft Access processes found")
+            print(f"⚠️  Killed {terminated} of {len(pids)} Microsoft Access processes")
     except Exception as e:
         print(f"⚠️  Could not kill Access processes: {e}")
 
-def clear_access_locks():
-    """Clear potential Access lock files."""
-    print("🔍 Checking for Access lock files...")
+def iter_lock_files(root):
+    """Yield paths of Access lock files under root, walking the tree once."""
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        name = entry.name.lower()
+                        if (name.endswith(('.ldb', '.laccdb')) or
+                                (name.startswith('~$') and name.endswith(('.mdb', '.accdb')))):
+                            yield entry.path
+        except OSError:
+            pass
+
+def wait_for_cleanup(lock_files=(), timeout=3.0, interval=0.05):
+    """Wait until no Access process is running and none of lock_files exists any
+    more. Returns True if cleanup finished before the timeout.
+    
+    lock_files are the paths found before the processes were terminated; only
+    they are polled, so the tree is not walked again on every tick. Where
+    processes cannot be listed this just waits out the timeout.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            processes_gone = not find_processes('MSACCESS.EXE')
+        except OSError:
+            time.sleep(max(0.0, deadline - time.monotonic()))
+            return False
+        locks_gone = not any(os.path.exists(path) for path in lock_files)
+        if processes_gone and locks_gone:
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+
+def clear_access_locks(verbose=False, lock_files=None):
+    """Clear potential Access lock files.
     
-    # Common lock file patterns
-    lock_patterns = ['*.ldb', '*.laccdb', '~$*.mdb', '~$*.accdb']
+    lock_files defaults to the lock files under the current directory. Per-file
+    messages are written in one batch at the end unless verbose is set, since
+    every console line is a blocking write on Windows.
+    """
+    print("🔍 Checking for Access lock files...")
     
-    current_dir = os.getcwd()
-    found_locks = False
+    lines = []
+    removed = 0
+    failed = 0
     
-    for pattern in lock_patterns:
+    # Lock files: *.ldb, *.laccdb, ~$*.mdb, ~$*.accdb
+    if lock_files is None:
+        lock_files = iter_lock_files(os.getcwd())
+    for lock_file in lock_files:
         try:
-            import glob
-            lock_files = glob.glob(os.path.join(current_dir, '**', pattern), recursive=True)
-            
-            for lock_file in lock_files:
-                try:
-                    os.remove(lock_file)
-                    print(f"🗑️  Removed lock file: {os.path.basename(lock_file)}")
-                    found_locks = True
-                except Exception as e:
-                    print(f"⚠️  Could not remove {os.path.basename(lock_file)}: {e}")
-        except Exception:
-            pass
+            os.remove(lock_file)
+            line = f"🗑️  Removed lock file: {os.path.basename(lock_file)}"
+            removed += 1
+        except FileNotFoundError:
+            continue  # Access removed it itself when it exited
+        except Exception as e:
+            line = f"⚠️  Could not remove {os.path.basename(lock_file)}: {e}"
+            failed += 1
+        if verbose:
+            print(line)
+        else:
+            lines.append(line)
     
-    if not found_locks:
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
+    
+    if removed or failed:
+        print(f"ℹ️  Removed {removed} lock files, {failed} could not be removed")
+    else:
         print("ℹ️  No lock files found")
 
+@functools.lru_cache(maxsize=1)
+def _get_win32com():
+    """Import win32com.client on first use; it is slow to import and Windows-only."""
+    import win32com.client
+    return win32com.client
+
+def dispatch_late_bound(prog_id, new_instance=False):
+    """Create a COM object with pure IDispatch late binding, bypassing gen_py.
+    
+    new_instance starts a separate server process, like DispatchEx, instead of
+    letting COM hand back an existing one.
+    """
+    win32com_client = _get_win32com()
+    if new_instance:
+        import pythoncom
+        dispatch = pythoncom.CoCreateInstance(prog_id, None, pythoncom.CLSCTX_LOCAL_SERVER,
+                                              pythoncom.IID_IDispatch)
+        return win32com_client.dynamic.Dispatch(dispatch, prog_id)
+    return win32com_client.dynamic.Dispatch(prog_id)
+
+@functools.lru_cache(maxsize=1)
+def get_gen_py_path():
+    """Locate the win32com gen_py cache directory once per process."""
+    return _get_win32com().gencache.GetGeneratePath()
+
 def clear_com_cache():
     """Clear COM automation cache."""
     print("🧹 Clearing COM cache...")
     
     try:
-        import win32com.client
-        # Clear the COM cache
-        win32com.client.gencache.GetGeneratePath()
         import shutil
-        cache_dir = win32com.client.gencache.GetGeneratePath()
+        # Clear the COM cache
+        cache_dir = get_gen_py_path()
         
         if os.path.exists(cache_dir):
             shutil.rmtree(cache_dir, ignore_errors=True)
@@ -76,10 +264,8 @@ def test_access_com():
     print("🧪 Testing Access COM automation...")
     
     try:
-        import win32com.client
-        
-        # Try to create Access application
-        access_app = win32com.client.Dispatch('Access.Application')
+        # Try to create Access application (late bound: the probe needs no type library)
+        access_app = dispatch_late_bound('Access.Application')
         print("✅ Access COM object created successfully")
         
         # Try to quit cleanly
@@ -94,23 +280,32 @@ def test_access_com():
 
 def main():
     """Main function to fix Access database issues."""
+    import argparse
+    parser = argparse.ArgumentParser(description="Fix 'database already open' errors in MS Access COM automation")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Report each lock file as it is handled instead of in one batch")
+    args = parser.parse_args()
+    
     print("🔧 MS ACCESS DATABASE LOCK FIXER")
     print("=" * 50)
     print("This script will fix common 'database already open' errors")
     print("=" * 50)
     
+    # Find the lock files once, before Access can remove some of them on exit
+    lock_files = list(iter_lock_files(os.getcwd()))
+    
     # Step 1: Kill any running Access processes
     kill_access_processes()
     
     # Step 2: Clear lock files
-    clear_access_locks()
+    clear_access_locks(verbose=args.verbose, lock_files=lock_files)
     
     # Step 3: Clear COM cache
     clear_com_cache()
     
     # Step 4: Wait a moment
     print("⏳ Waiting for cleanup to complete...")
-    time.sleep(3)
+    wait_for_cleanup(lock_files, timeout=3.0)
     
     # Step 5: Test Access COM
     if test_access_com():
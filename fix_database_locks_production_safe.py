@@ -8,16 +8,32 @@ import os
 import sys
 import time
 
-def check_access_processes():
-    """Check for running Microsoft Access processes WITHOUT killing them."""
+from fix_database_locks import dispatch_late_bound, find_processes, get_gen_py_path, run_hidden, wait_for_cleanup
+
+def check_access_processes(pids=None):
+    """Check for running Microsoft Access processes WITHOUT killing them.
+    
+    pids is a find_processes('MSACCESS.EXE') snapshot taken by the caller;
+    processes are only listed here when it is not given.
+    """
     print("🔍 Checking for running Microsoft Access processes...")
     
     try:
-        import subprocess
-        result = subprocess.run(['tasklist', '/FI', 'IMAGENAME eq MSACCESS.EXE'], 
-                              capture_output=True, text=True)
+        try:
+            if pids is None:
+                pids = find_processes('MSACCESS.EXE')
+            running = bool(pids)
+        except OSError:
+            # Toolhelp API unavailable - fall back to tasklist
+            import subprocess
+            try:
+                result = run_hidden(['tasklist', '/FI', 'IMAGENAME eq MSACCESS.EXE'])
+            except subprocess.TimeoutExpired:
+                print("ℹ️  Could not check Access processes: tasklist timed out")
+                return False
+            running = 'MSACCESS.EXE' in result.stdout
         
-        if 'MSACCESS.EXE' in result.stdout:
+        if running:
             print("⚠️  WARNING: Microsoft Access is currently running!")
             print("   This may cause 'database already open' errors.")
             print("   Consider closing Access applications if they're not needed.")
@@ -29,55 +45,75 @@ def check_access_processes():
         print(f"ℹ️  Could not check Access processes: {e}")
         return False
 
-def check_lock_files_in_source_only(source_dir=None):
-    """Check for Access lock files ONLY in the source directory being processed."""
+def check_lock_files_in_source_only(source_dir=None, assume_yes=False):
+    """Check for Access lock files ONLY in the source directory being processed.
+    
+    Without a terminal, a missing source_dir skips the check and lock files are
+    only removed when assume_yes is set.
+    """
     print("🔍 Checking for Access lock files in source directory...")
     
+    interactive = sys.stdin.isatty()
     if not source_dir:
+        if not interactive:
+            print("ℹ️  No source directory given - skipping lock file check")
+            return False
         source_dir = input("Enter the source directory path for MDB files: ").strip('"')
     
-    if not os.path.exists(source_dir):
-        print(f"❌ Source directory not found: {source_dir}")
-        return False
-    
-    # Lock file patterns - only check in source directory
-    lock_patterns = ['*.ldb', '*.laccdb']
-    
+    # Lock files (*.ldb, *.laccdb) - only check in source directory, not recursively;
+    # keep each entry's stat result so size and mtime need no further syscalls, and
+    # let scandir report a missing directory instead of checking for it first
     found_locks = []
     
-    for pattern in lock_patterns:
-        try:
-            import glob
-            # Only search in the specific source directory, not recursively
-            lock_files = glob.glob(os.path.join(source_dir, pattern))
-            found_locks.extend(lock_files)
-        except Exception:
-            pass
+    try:
+        with os.scandir(source_dir) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False) and entry.name.lower().endswith(('.ldb', '.laccdb')):
+                    try:
+                        found_locks.append((entry.path, entry.stat()))
+                    except FileNotFoundError:
+                        pass  # Released while listing
+    except FileNotFoundError:
+        print(f"❌ Source directory not found: {source_dir}")
+        return False
+    except OSError:
+        pass
     
     if found_locks:
-        print(f"⚠️  Found {len(found_locks)} lock files in source directory:")
-        for lock_file in found_locks:
-            file_size = os.path.getsize(lock_file) if os.path.exists(lock_file) else 0
-            modified_time = time.ctime(os.path.getmtime(lock_file)) if os.path.exists(lock_file) else "Unknown"
-            print(f"   📄 {os.path.basename(lock_file)} ({file_size} bytes, modified: {modified_time})")
+        # One console write for the whole listing rather than one per file
+        lines = [f"⚠️  Found {len(found_locks)} lock files in source directory:"]
+        for lock_file, stat_result in found_locks:
+            file_size = stat_result.st_size
+            modified_time = time.ctime(stat_result.st_mtime)
+            lines.append(f"   📄 {os.path.basename(lock_file)} ({file_size} bytes, modified: {modified_time})")
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
         
         print("\n💡 PRODUCTION-SAFE OPTIONS:")
         print("1. These may be old lock files from previous sessions")
         print("2. If databases are NOT currently open, it's safe to remove them")
         print("3. If databases ARE currently open, DO NOT remove lock files")
         
-        user_choice = input("\nAre you sure these databases are NOT currently open? (y/N): ").lower()
+        if assume_yes:
+            user_choice = 'y'
+        elif interactive:
+            user_choice = input("\nAre you sure these databases are NOT currently open? (y/N): ").lower()
+        else:
+            user_choice = 'n'
         
         if user_choice == 'y':
             removed_count = 0
-            for lock_file in found_locks:
+            lines = []
+            for lock_file, _ in found_locks:
                 try:
                     os.remove(lock_file)
-                    print(f"🗑️  Removed: {os.path.basename(lock_file)}")
+                    lines.append(f"🗑️  Removed: {os.path.basename(lock_file)}")
                     removed_count += 1
                 except Exception as e:
-                    print(f"⚠️  Could not remove {os.path.basename(lock_file)}: {e}")
-                    print("   (This usually means the database is actually open)")
+                    lines.append(f"⚠️  Could not remove {os.path.basename(lock_file)}: {e}")
+                    lines.append("   (This usually means the database is actually open)")
+            sys.stdout.write('\n'.join(lines) + '\n')
+            sys.stdout.flush()
             
             if removed_count > 0:
                 print(f"✅ Removed {removed_count} lock files safely")
@@ -89,29 +125,54 @@ def check_lock_files_in_source_only(source_dir=None):
         print("✅ No lock files found in source directory")
         return False
 
+# COM cache backups older than this are removed on the next run
+COM_CACHE_BACKUP_MAX_AGE_DAYS = 7
+
+def prune_com_cache_backups(cache_dir):
+    """Remove COM cache backups left by earlier runs once they are old enough."""
+    import shutil
+    
+    parent, name = os.path.split(os.path.normpath(cache_dir))
+    prefix = f"{name}_backup_"
+    cutoff = time.time() - COM_CACHE_BACKUP_MAX_AGE_DAYS * 86400
+    try:
+        with os.scandir(parent) as entries:
+            for entry in entries:
+                # Age comes from the timestamp in the name: a renamed backup keeps
+                # the original cache directory's mtime
+                created = entry.name[len(prefix):]
+                if (entry.name.startswith(prefix) and created.isdigit() and int(created) < cutoff
+                        and entry.is_dir(follow_symlinks=False)):
+                    shutil.rmtree(entry.path, ignore_errors=True)
+                    print(f"🗑️  Removed old COM cache backup: {entry.name}")
+    except OSError:
+        pass
+
 def clear_com_cache_safe():
     """Safely clear COM automation cache without affecting running processes."""
     print("🧹 Clearing COM cache (safe for production)...")
     
     try:
-        import win32com.client
-        import tempfile
-        import shutil
-        
         # Get current cache path
-        cache_dir = win32com.client.gencache.GetGeneratePath()
+        cache_dir = get_gen_py_path()
         
         if os.path.exists(cache_dir):
-            # Create backup first (safety measure)
+            # Move the cache aside as the backup (safety measure); gen_py is
+            # regenerated on the next COM call
             backup_dir = f"{cache_dir}_backup_{int(time.time())}"
-            shutil.copytree(cache_dir, backup_dir, ignore_errors=True)
-            
-            # Clear cache
-            shutil.rmtree(cache_dir, ignore_errors=True)
+            try:
+                os.rename(cache_dir, backup_dir)
+            except OSError:
+                # Different filesystem or files in use - copy, then clear
+                import shutil
+                shutil.copytree(cache_dir, backup_dir)
+                shutil.rmtree(cache_dir, ignore_errors=True)
             print("✅ COM cache cleared (backup created)")
             print(f"   Backup location: {backup_dir}")
         else:
             print("ℹ️  COM cache directory not found")
+        
+        prune_com_cache_backups(cache_dir)
     except Exception as e:
         print(f"⚠️  Could not clear COM cache: {e}")
 
@@ -120,11 +181,10 @@ def test_access_com_safe():
     print("🧪 Testing Access COM automation (production-safe)...")
     
     try:
-        import win32com.client
-        
         # Try to create a NEW Access application instance
-        # Use CreateObject instead of GetObject to avoid connecting to existing instances
-        access_app = win32com.client.DispatchEx('Access.Application')  # DispatchEx creates new instance
+        # Use CreateObject instead of GetObject to avoid connecting to existing instances;
+        # late binding skips gen_py, so a cold or cleared COM cache costs nothing here
+        access_app = dispatch_late_bound('Access.Application', new_instance=True)
         access_app.Visible = False  # Keep it invisible
         
         print("✅ New Access COM instance created successfully")
@@ -171,8 +231,17 @@ def suggest_production_safe_solutions():
     print("   - Use --no-progress-thread for minimal system impact")
     print("   - Monitor system resources during conversion")
 
-def main():
+def main(argv=None):
     """Main function for production-safe database lock fixing."""
+    import argparse
+    parser = argparse.ArgumentParser(description="Production-safe checks for MS Access 'database already open' errors")
+    parser.add_argument("source_dir", nargs="?", help="Directory containing the MDB files")
+    parser.add_argument("--source-dir", dest="source_dir_option", metavar="DIR",
+                        help="Directory containing the MDB files (same as the positional argument)")
+    parser.add_argument("--yes", action="store_true",
+                        help="Remove lock files found in the source directory without asking")
+    args = parser.parse_args(argv)
+    
     print("🛡️  PRODUCTION-SAFE MS ACCESS LOCK CHECKER")
     print("=" * 50)
     print("This script is safe to run in production environments.")
@@ -180,25 +249,35 @@ def main():
     print("=" * 50)
     
     # Get source directory
-    source_dir = None
-    if len(sys.argv) > 1:
-        source_dir = sys.argv[1]
+    source_dir = args.source_dir_option or args.source_dir
     
-    # Step 1: Check for running Access processes (non-destructive)
-    has_running_access = check_access_processes()
+    # Step 1: Check for running Access processes (non-destructive); this one
+    # snapshot decides the later phases too
+    try:
+        access_pids = find_processes('MSACCESS.EXE')
+    except OSError:
+        access_pids = None
+    has_running_access = check_access_processes(access_pids)
     
     # Step 2: Check for lock files in source directory only
-    has_locks = check_lock_files_in_source_only(source_dir)
-    
-    # Step 3: Clear COM cache safely
-    clear_com_cache_safe()
-    
-    # Step 4: Wait for cleanup
-    print("⏳ Waiting for cleanup to complete...")
-    time.sleep(2)
+    has_locks = check_lock_files_in_source_only(source_dir, assume_yes=args.yes)
     
-    # Step 5: Test Access COM safely
-    com_works = test_access_com_safe()
+    if has_running_access:
+        # Removing gen_py under a running instance is unsafe, and a new instance
+        # would contend with it, so neither step can help now
+        print("⏭️  Skipping COM cache clearing and COM test while Access is running")
+        com_works = False
+    else:
+        # Step 3: Clear COM cache safely
+        clear_com_cache_safe()
+        
+        # Step 4: Wait for cleanup (only needed if the snapshot could not be taken)
+        if access_pids is None:
+            print("⏳ Waiting for cleanup to complete...")
+            wait_for_cleanup(timeout=2.0)
+        
+        # Step 5: Test Access COM safely
+        com_works = test_access_com_safe()
     
     # Step 6: Provide recommendations
     print("\n" + "=" * 60)
@@ -230,7 +309,8 @@ def main():
     suggest_production_safe_solutions()
     
     print("\n🔗 For more help, see: DEPLOYMENT_CHECKLIST.md")
-    input("\nPress Enter to exit...")
+    if sys.stdin.isatty():
+        input("\nPress Enter to exit...")
 
 if __name__ == "__main__":
     main()
@@ -4,13 +4,22 @@ Alternative MS Access to MySQL converter for very old MDB files.
 This version provides multiple connection methods and fallback options.
 """
 
+import io
 import os
+import re
+import csv
 import sys
 import logging
+import threading
+import shutil
 import subprocess
 import tempfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import chain, islice
 from pathlib import Path
 from access_to_mysql_converter import AccessToMySQLConverter
+from mysql_bulk_load import (INNODB_ROW_SIZE_LIMIT, insert_rows, load_data_local_infile, qualified_table_name,
+                             quote_identifier)
 import platform
 
 try:
@@ -20,16 +29,142 @@ except ImportError as e:
     print(f"Missing required package: {e}")
     sys.exit(1)
 
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:
+    pacsv = None  # Optional: exported CSVs are read with pandas instead
+
+# Rows read from an exported CSV to infer column types; the data itself is
+# streamed to the server by LOAD DATA
+CSV_SCHEMA_SAMPLE_ROWS = 10000
+
+# Exports with at most this many rows are typed and inserted straight from the csv
+# module, without pandas/pyarrow or LOAD DATA
+TINY_TABLE_ROWS = 100
+
+# Rows read per batch when inserting without LOAD DATA
+INSERT_BATCH_SIZE = 20000
+
+# MySQL type for each numpy dtype kind of a pandas-read column; anything else is text
+# (booleans included: LOAD DATA would get the literal True/False text)
+DTYPE_KIND_MYSQL_TYPES = {
+    'i': 'BIGINT',
+    'u': 'BIGINT',
+    'f': 'DOUBLE',
+    'M': 'DATETIME',
+}
+
+# Session-scoped tuning for connections that import tables; the tables are created
+# without keys, so the checks only cost time. The pool resets the session on return.
+IMPORT_SESSION_VARS = {
+    'unique_checks': 0,
+    'foreign_key_checks': 0,
+    'bulk_insert_buffer_size': 256 << 20,
+}
+
+# Bytes per block for the pyarrow CSV reader; the first block drives type inference
+ARROW_BLOCK_SIZE = 16 << 20
+
+# Date format requested from mdb-export, so MySQL accepts the values as DATETIME
+MDB_EXPORT_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# OLE DB providers tried, in order, to read tables over ADO on the COM path
+ADO_PROVIDERS = ['Microsoft.ACE.OLEDB.12.0', 'Microsoft.Jet.OLEDB.4.0']
+
+# ADO DataTypeEnum -> MySQL type for tables read over ADO; anything else is text
+ADO_MYSQL_TYPES = {
+    2: 'SMALLINT',            # adSmallInt
+    3: 'INT',                 # adInteger
+    4: 'DOUBLE',              # adSingle
+    5: 'DOUBLE',              # adDouble
+    6: 'DECIMAL(19,4)',       # adCurrency
+    7: 'DATETIME',            # adDate
+    11: 'TINYINT(1)',         # adBoolean
+    16: 'TINYINT',            # adTinyInt
+    17: 'TINYINT UNSIGNED',   # adUnsignedTinyInt
+    20: 'BIGINT',             # adBigInt
+    72: 'VARCHAR(38)',        # adGUID
+    128: 'BLOB',              # adBinary
+    131: 'DECIMAL(28,6)',     # adNumeric
+    203: 'LONGTEXT',          # adLongVarWChar (Memo)
+    204: 'BLOB',              # adVarBinary
+    205: 'LONGBLOB',          # adLongVarBinary (OLE Object)
+}
+ADO_VARWCHAR = 202
+
+# Value shapes used to infer column types from mdb-export text
+_EXPORT_INT_RE = re.compile(r'-?\d+')
+_EXPORT_DATETIME_RE = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}')
+
+# Signed BIGINT range; larger exported integers are stored as DOUBLE
+BIGINT_MIN, BIGINT_MAX = -(1 << 63), (1 << 63) - 1
+
+# The column a MySQL data error names, as 'col' or `db`.`table`.`col`
+_COLUMN_ERROR_RE = re.compile(r"for column (?:'([^']*)'|(?:`[^`]*`\.)*`([^`]*)`)")
+
+# Text types, narrowest first, for values too long for their column
+TEXT_TYPES = ['TEXT', 'MEDIUMTEXT', 'LONGTEXT']
+
 
 class LegacyAccessConverter(AccessToMySQLConverter):
     """Extended converter for very old Access databases (.mdb files)."""
     
-    def __init__(self, source_dir: str, mysql_config: dict, log_dir: str = "logs"):
-        super().__init__(source_dir, mysql_config, log_dir)
+    def __init__(self, source_dir: str, mysql_config: dict, log_dir: str = "logs",
+                 parallelism: int = 1, table_workers: int = None):
+        # Local infile is needed for LOAD DATA LOCAL INFILE of the exported CSVs
+        super().__init__(source_dir, {**mysql_config, 'allow_local_infile': True}, log_dir, parallelism)
         self.conversion_methods = ['odbc', 'com', 'export']
+        
+        # Exported tables are imported by a thread pool, one pooled connection per thread,
+        # while the converting thread holds one more (ADO imports on the COM path); a
+        # mysql.connector pool holds at most 32 connections
+        self.table_workers = min(31, table_workers or min(8, os.cpu_count() or 4))
+        self.mysql_pool_size = min(32, max(self.mysql_pool_size, self.table_workers + 1))
+        
+        # Thread ident -> connection kept across tables of the database being converted
+        self._table_conns = {}
+        
+        # Result of check_access_installation(); the registry does not change during a run
+        self._access_installed = None
+    
+    def borrow_table_connection(self):
+        """Return this thread's MySQL connection, borrowing one from the pool on first use.
+        
+        The connection is kept across tables until release_table_connections().
+        """
+        thread_id = threading.get_ident()
+        conn = self._table_conns.get(thread_id)
+        if conn is None:
+            conn = self.connect_to_mysql()
+            if conn:
+                cursor = conn.cursor()
+                for name, value in IMPORT_SESSION_VARS.items():
+                    cursor.execute(f"SET SESSION {name} = %s", (value,))
+                cursor.close()
+                self._table_conns[thread_id] = conn
+        return conn
+    
+    def drop_table_connection(self):
+        """Return this thread's connection to the pool after a failed import; the reset rolls it back."""
+        conn = self._table_conns.pop(threading.get_ident(), None)
+        if conn:
+            conn.close()
+    
+    def release_table_connections(self):
+        """Return all connections held by borrow_table_connection() to the pool."""
+        conns, self._table_conns = self._table_conns, {}
+        for conn in conns.values():
+            conn.close()
     
     def check_access_installation(self) -> bool:
-        """Check if Microsoft Access is installed on the system."""
+        """Check if Microsoft Access is installed on the system (cached after the first call)."""
+        if self._access_installed is None:
+            self._access_installed = self.find_access_installation()
+        return self._access_installed
+    
+    def find_access_installation(self) -> bool:
+        """Look for an Access version key in the Office registry hives."""
         if platform.system() != "Windows":
             return False
         
@@ -45,21 +180,17 @@ class LegacyAccessConverter(AccessToMySQLConverter):
             for base_path in access_paths:
                 try:
                     with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, base_path) as key:
-                        i = 0
-                        while True:
-                            try:
-                                subkey_name = winreg.EnumKey(key, i)
-                                if subkey_name.replace(".", "").isdigit():
-                                    try:
-                                        access_path = f"{base_path}\\{subkey_name}\\Access"
-                                        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, access_path):
-                                            self.logger.info(f"Found Microsoft Access {subkey_name}")
-                                            return True
-                                    except FileNotFoundError:
-                                        pass
-                                i += 1
-                            except OSError:
-                                break
+                        subkey_count = winreg.QueryInfoKey(key)[0]
+                        for i in range(subkey_count):
+                            subkey_name = winreg.EnumKey(key, i)
+                            if subkey_name.replace(".", "").isdigit():
+                                try:
+                                    access_path = f"{base_path}\\{subkey_name}\\Access"
+                                    with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, access_path):
+                                        self.logger.info(f"Found Microsoft Access {subkey_name}")
+                                        return True
+                                except FileNotFoundError:
+                                    pass
                 except FileNotFoundError:
                     continue
             
@@ -99,23 +230,43 @@ class LegacyAccessConverter(AccessToMySQLConverter):
                 
                 self.logger.info(f"Found {len(table_names)} tables via COM")
                 
-                # Export each table
-                for table_name in table_names:
-                    try:
-                        csv_file = temp_dir / f"{table_name}.csv"
-                        access.DoCmd.TransferText(
-                            TransferType=2,  # acExportDelim
-                            TableName=table_name,
-                            FileName=str(csv_file),
-                            HasFieldNames=True
-                        )
-                        
-                        # Import CSV to MySQL
-                        self.import_csv_to_mysql(csv_file, db_name, table_name)
-                        
-                    except Exception as e:
-                        self.logger.error(f"Failed to export table {table_name}: {e}")
-                        continue
+                # Read tables straight from the engine over ADO where a provider is
+                # installed; TransferText to CSV remains the fallback
+                ado_conn = self.open_ado_connection(db_path)
+                
+                # Export each table on this thread (Access automation lives in a
+                # single-threaded apartment) while earlier exports are imported
+                # to MySQL in the background. Exports wait while enough CSVs are
+                # queued, so the temp directory holds only a few tables at a time.
+                max_pending = self.table_workers * 2
+                pending = set()
+                try:
+                    with ThreadPoolExecutor(max_workers=self.table_workers) as executor:
+                        for table_name in table_names:
+                            if ado_conn is not None and self.import_ado_table(ado_conn, db_name, table_name):
+                                continue
+                            if len(pending) >= max_pending:
+                                _, pending = wait(pending, return_when=FIRST_COMPLETED)
+                            try:
+                                csv_file = temp_dir / f"{table_name}.csv"
+                                access.DoCmd.TransferText(
+                                    TransferType=2,  # acExportDelim
+                                    TableName=table_name,
+                                    FileName=str(csv_file),
+                                    HasFieldNames=True
+                                )
+                                
+                                # Import CSV to MySQL
+                                pending.add(executor.submit(self.import_exported_csv, csv_file, db_name, table_name))
+                                
+                            except Exception as e:
+                                self.logger.error(f"Failed to export table {table_name}: {e}")
+                                continue
+                finally:
+                    if ado_conn is not None:
+                        ado_conn.Close()
+                    self.release_table_connections()
+                    shutil.rmtree(temp_dir, ignore_errors=True)
                 
                 return True
                 
@@ -127,77 +278,509 @@ class LegacyAccessConverter(AccessToMySQLConverter):
             self.logger.error(f"COM conversion failed: {e}")
             return False
     
+    def open_ado_connection(self, db_path: Path):
+        """Open an ADO connection to an Access database, or return None if no provider works."""
+        import win32com.client
+        
+        for provider in ADO_PROVIDERS:
+            try:
+                ado_conn = win32com.client.Dispatch("ADODB.Connection")
+                ado_conn.Open(f"Provider={provider};Data Source={db_path.absolute()}")
+                self.logger.info(f"Reading tables over ADO with {provider}")
+                return ado_conn
+            except Exception as e:
+                self.logger.debug(f"ADO provider {provider} failed: {e}")
+        self.logger.info("No ADO provider available, exporting tables through CSV")
+        return None
+    
+    def import_ado_table(self, ado_conn, db_name: str, table_name: str) -> bool:
+        """Copy one table from an ADO recordset into MySQL, INSERT_BATCH_SIZE rows at a time.
+        
+        Column types come from the recordset's field types; all rows are inserted in one
+        transaction. Returns False if the table should be exported through CSV instead.
+        """
+        recordset = None
+        try:
+            result = ado_conn.Execute(f"SELECT * FROM [{table_name}]")
+            # Execute returns (recordset, records affected) through win32com
+            recordset = result[0] if isinstance(result, tuple) else result
+            
+            schema = []
+            for i in range(recordset.Fields.Count):
+                field = recordset.Fields.Item(i)
+                if field.Type == ADO_VARWCHAR and 0 < field.DefinedSize <= 255:
+                    mysql_type = f'VARCHAR({field.DefinedSize})'
+                else:
+                    mysql_type = ADO_MYSQL_TYPES.get(field.Type, 'TEXT')
+                schema.append((field.Name, mysql_type))
+            
+            mysql_conn = self.borrow_table_connection()
+            if not mysql_conn:
+                return False
+            
+            cursor = mysql_conn.cursor()
+            sanitized_table_name, column_names = self.create_import_table(cursor, db_name, table_name, schema)
+            mysql_conn.commit()
+            
+            def iter_rows():
+                while not recordset.EOF:
+                    # GetRows returns one tuple per field; zip turns it into row tuples
+                    yield from zip(*recordset.GetRows(INSERT_BATCH_SIZE))
+            
+            mysql_conn.start_transaction()
+            record_count = insert_rows(mysql_conn, iter_rows(), db_name, sanitized_table_name,
+                                       column_names, INSERT_BATCH_SIZE)
+            mysql_conn.commit()
+            
+            self.logger.info(f"Successfully imported {record_count} records from {table_name} over ADO")
+            return True
+            
+        except Exception as e:
+            self.logger.warning(f"ADO import of {table_name} failed, falling back to CSV export: {e}")
+            self.drop_table_connection()
+            return False
+        finally:
+            if recordset is not None and recordset.State:
+                recordset.Close()
+    
+    def open_arrow_csv(self, csv_file: Path, column_types: dict = None):
+        """Open an exported CSV with pyarrow's multi-threaded streaming reader."""
+        return pacsv.open_csv(
+            csv_file,
+            read_options=pacsv.ReadOptions(block_size=ARROW_BLOCK_SIZE, use_threads=True),
+            # Treat empty fields as NULL in text columns too, as pandas does
+            convert_options=pacsv.ConvertOptions(column_types=column_types or {}, strings_can_be_null=True),
+        )
+    
+    @staticmethod
+    def arrow_to_mysql_type(arrow_type) -> str:
+        """Map an Arrow column type to the MySQL type used for it."""
+        if pa.types.is_integer(arrow_type):
+            return 'BIGINT'
+        if pa.types.is_floating(arrow_type):
+            return 'DOUBLE'
+        if pa.types.is_timestamp(arrow_type) or pa.types.is_date(arrow_type):
+            return 'DATETIME'
+        return 'TEXT'
+    
+    def read_csv_schema(self, csv_file: Path) -> list:
+        """Infer (column name, MySQL type) pairs from the head of an exported CSV.
+        
+        Returns an empty list if the CSV has no data rows.
+        """
+        if pacsv is not None:
+            reader = self.open_arrow_csv(csv_file)
+            try:
+                reader.read_next_batch()
+            except StopIteration:
+                return []
+            return [(field.name, self.arrow_to_mysql_type(field.type)) for field in reader.schema]
+        
+        import pandas as pd
+        
+        df = pd.read_csv(csv_file, encoding='utf-8', low_memory=False, nrows=CSV_SCHEMA_SAMPLE_ROWS)
+        if df.empty:
+            return []
+        
+        # Short strings only get a VARCHAR when the sample is the whole file;
+        # otherwise a longer value may still follow
+        whole_file = len(df) < CSV_SCHEMA_SAMPLE_ROWS
+        schema = []
+        row_bytes = 0
+        for col in df.columns:
+            mysql_type = DTYPE_KIND_MYSQL_TYPES.get(df[col].dtype.kind, 'TEXT')
+            if mysql_type == 'TEXT' and whole_file:
+                max_len = df[col].dropna().astype(str).str.len().max()
+                if pd.notna(max_len) and max_len <= 255:
+                    width = min(int(max_len) + 50, 255)
+                    if row_bytes + width * 4 < INNODB_ROW_SIZE_LIMIT:
+                        mysql_type = f'VARCHAR({width})'
+                        row_bytes += width * 4
+            schema.append((col, mysql_type))
+        return schema
+    
+    def iter_csv_row_batches(self, csv_file: Path, header: list):
+        """Yield lists of row tuples from an exported CSV, INSERT_BATCH_SIZE rows at most.
+        
+        Values come through as text, as with LOAD DATA, and missing values as None;
+        MySQL converts the text to the column types. Reading every column as text
+        also keeps pyarrow from failing on a later block that does not match the
+        types it inferred from the first one.
+        """
+        if pacsv is not None:
+            for batch in self.open_arrow_csv(csv_file, dict.fromkeys(header, pa.string())):
+                for offset in range(0, batch.num_rows, INSERT_BATCH_SIZE):
+                    part = batch.slice(offset, INSERT_BATCH_SIZE)
+                    yield list(zip(*(column.to_pylist() for column in part.columns)))
+            return
+        
+        import pandas as pd
+        
+        for chunk in pd.read_csv(csv_file, encoding='utf-8', dtype=str, chunksize=INSERT_BATCH_SIZE):
+            # Object array with None written in at the missing cells, so no second frame is built
+            values = chunk.to_numpy(dtype=object)
+            values[chunk.isna().to_numpy()] = None
+            yield [tuple(row) for row in values.tolist()]
+    
+    @classmethod
+    def widen_export_type(cls, mysql_type: str, values) -> str:
+        """Return the narrowest type, no narrower than mysql_type, that holds exported text values."""
+        if mysql_type in TEXT_TYPES:
+            return mysql_type
+        present = [str(v) for v in values if v is not None]
+        if not present:
+            return mysql_type
+        value_type = cls.infer_export_column_type(present)
+        if value_type == mysql_type:
+            return mysql_type
+        if {mysql_type, value_type} <= {'BIGINT', 'DOUBLE'}:
+            return 'DOUBLE'
+        return 'TEXT'
+    
+    def widen_column_types(self, error, batch: list, columns: list, column_types: list) -> dict:
+        """Work out wider types for the columns a failed batch does not fit.
+        
+        The column named in MySQL's error is widened to the narrowest type that holds
+        the batch's values, or one step up TEXT_TYPES if its type should already hold
+        them (a value too long, say). If the error names no column, every column whose
+        values need a wider type is widened. Returns {column index: new type}.
+        """
+        match = _COLUMN_ERROR_RE.search(str(error))
+        named = match and (match[1] if match[1] is not None else match[2])
+        indexes = [columns.index(named)] if named in columns else range(len(columns))
+        
+        widened = {}
+        for i in indexes:
+            new_type = self.widen_export_type(column_types[i], [row[i] for row in batch])
+            if new_type == column_types[i] and named in columns:
+                if new_type not in TEXT_TYPES:
+                    new_type = 'TEXT'
+                elif new_type != TEXT_TYPES[-1]:
+                    new_type = TEXT_TYPES[TEXT_TYPES.index(new_type) + 1]
+            if new_type != column_types[i]:
+                widened[i] = new_type
+        return widened
+    
+    def insert_row_batches(self, conn, batches, reopen, db_name: str, table_name: str, columns: list,
+                           column_types: list) -> int:
+        """Insert batches of row tuples in the caller's transaction, widening columns that turn out too narrow.
+        
+        column_types are the types the table was created with, inferred from a sample
+        of the rows; they are updated in place. When a batch holds a value its column
+        cannot take, the transaction is rolled back, the column is widened with ALTER
+        TABLE and the rows are inserted again from reopen(), a fresh iterable over the
+        same batches, so no row is dropped or coerced. Errors that widening cannot fix
+        are raised. Does not commit; returns the number of rows inserted.
+        """
+        while True:
+            record_count = 0
+            widened = None
+            try:
+                for batch in batches:
+                    try:
+                        record_count += insert_rows(conn, batch, db_name, table_name, columns, INSERT_BATCH_SIZE)
+                    except mysql.connector.Error as e:
+                        widened = self.widen_column_types(e, batch, columns, column_types)
+                        if not widened:
+                            raise
+                        break
+                else:
+                    return record_count
+            finally:
+                # Stop a running export before it is started again
+                if hasattr(batches, 'close'):
+                    batches.close()
+            
+            # ALTER TABLE commits implicitly, so roll this table's rows back first
+            conn.rollback()
+            cursor = conn.cursor()
+            try:
+                for i, new_type in widened.items():
+                    self.logger.warning(f"Column {columns[i]} of {table_name} does not fit {column_types[i]} "
+                                        f"further down the data, widening it to {new_type} and inserting again")
+                    cursor.execute(f"ALTER TABLE {qualified_table_name(db_name, table_name)} "
+                                   f"MODIFY {quote_identifier(columns[i])} {new_type}")
+                    column_types[i] = new_type
+            finally:
+                cursor.close()
+            conn.start_transaction()
+            batches = reopen()
+    
+    def insert_csv_rows(self, conn, csv_file: Path, header: list, db_name: str, table_name: str, columns: list,
+                        column_types: list) -> int:
+        """Insert an exported CSV into an existing table without LOAD DATA.
+        
+        The CSV is read in batches, so it is never fully in memory, and read again
+        from the start if a column has to be widened. Does not commit; returns the
+        number of rows inserted.
+        """
+        return self.insert_row_batches(conn, self.iter_csv_row_batches(csv_file, header),
+                                       lambda: self.iter_csv_row_batches(csv_file, header),
+                                       db_name, table_name, columns, column_types)
+    
+    def migrate_table_data(self, access_conn: pyodbc.Connection, mysql_conn, source_table: str,
+                           target_db: str, target_table: str) -> int:
+        """Stream a table from ODBC to MySQL in fetchmany batches of INSERT_BATCH_SIZE rows.
+        
+        Unlike the base class this never loads the whole table into a DataFrame. Each
+        batch goes in as prepared extended INSERTs and is committed; a batch that fails
+        is retried through insert_batch_bisect to skip only the bad rows, which are
+        counted in the statistics. Returns the number of rows inserted.
+        """
+        queries_to_try = [
+            f"SELECT * FROM `{source_table}`",
+            f"SELECT * FROM [{source_table}]",
+            f"SELECT * FROM {source_table}",
+        ]
+        
+        access_cursor = access_conn.cursor()
+        access_cursor.arraysize = INSERT_BATCH_SIZE
+        cursor = mysql_conn.cursor()
+        try:
+            for query in queries_to_try:
+                try:
+                    access_cursor.execute(query)
+                    self.logger.debug(f"Successfully read data using query: {query}")
+                    break
+                except Exception as e:
+                    self.logger.debug(f"Query failed: {query} - {e}")
+            else:
+                self.logger.error(f"Could not read data from table {source_table} with any query method")
+                return 0
+            
+            columns = [self.sanitize_name(column[0]) for column in access_cursor.description]
+            column_list = ', '.join([f"`{col}`" for col in columns])
+            placeholders = ', '.join(['%s'] * len(columns))
+            insert_sql = f"INSERT INTO `{target_db}`.`{target_table}` ({column_list}) VALUES ({placeholders})"
+            
+            total_rows = 0
+            skipped_rows = 0
+            while batch := access_cursor.fetchmany(INSERT_BATCH_SIZE):
+                # Truncate very long strings, as the base class does
+                values = [tuple(v[:65535] if isinstance(v, str) else v for v in row) for row in batch]
+                try:
+                    insert_rows(mysql_conn, values, target_db, target_table, columns, INSERT_BATCH_SIZE)
+                except mysql.connector.Error as e:
+                    self.logger.warning(f"Batch insert failed, splitting batch to isolate problematic rows: {e}")
+                    mysql_conn.rollback()
+                    skipped = self.insert_batch_bisect(cursor, insert_sql, values)
+                    skipped_rows += skipped
+                    total_rows -= skipped
+                mysql_conn.commit()
+                total_rows += len(values)
+                self.logger.debug("Inserted %d rows from %s so far", total_rows, source_table)
+            
+            self.record_skipped_rows(source_table, skipped_rows)
+            if total_rows == 0 and not skipped_rows:
+                self.logger.info(f"Table {source_table} is empty")
+            else:
+                self.logger.info(f"Migrated {total_rows} records from {source_table} to {target_table}")
+            return total_rows
+            
+        except Exception as e:
+            self.logger.error(f"Failed to migrate data for table {source_table}: {e}")
+            return 0
+        finally:
+            access_cursor.close()
+            cursor.close()
+    
+    def create_import_table(self, cursor, db_name: str, table_name: str, schema: list) -> tuple:
+        """Create the database and the table for (column name, MySQL type) pairs if missing.
+        
+        Does not commit; returns the sanitized table name and column names.
+        """
+        # Create database if not exists
+        cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{db_name}` CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci")
+        
+        sanitized_table_name = self.sanitize_name(table_name)
+        column_names = [self.sanitize_name(col) for col, _ in schema]
+        
+        # Create table; the column definitions are joined straight from a generator
+        columns_ddl = ',\n    '.join(f"`{col}` {mysql_type}" for col, (_, mysql_type) in zip(column_names, schema))
+        create_sql = f"""
+        CREATE TABLE IF NOT EXISTS `{db_name}`.`{sanitized_table_name}` (
+            {columns_ddl}
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+        """
+        
+        cursor.execute(create_sql)
+        return sanitized_table_name, column_names
+    
     def import_csv_to_mysql(self, csv_file: Path, db_name: str, table_name: str) -> bool:
         """Import CSV file to MySQL."""
         try:
-            import pandas as pd
-            
-            # Read CSV
-            df = pd.read_csv(csv_file, encoding='utf-8', low_memory=False)
+            # Look at the first rows with the csv module before involving pandas or pyarrow:
+            # header-only exports are skipped and tiny tables are inserted directly
+            with open(csv_file, encoding='utf-8', newline='') as f:
+                reader = csv.reader(f)
+                header = next(reader, None)
+                head_rows = [tuple(v if v != '' else None for v in row)
+                             for row in islice(filter(None, reader), TINY_TABLE_ROWS + 1)]
             
-            if df.empty:
+            if header is None or not head_rows:
                 return True
             
-            # Connect to MySQL
-            mysql_conn = self.connect_to_mysql()
+            tiny = len(head_rows) <= TINY_TABLE_ROWS
+            if tiny:
+                schema = self.infer_text_schema(header, head_rows)
+            else:
+                # Read only the head of the CSV, for type inference
+                schema = self.read_csv_schema(csv_file)
+            
+            # Connect to MySQL; the connection stays open for the next table
+            mysql_conn = self.borrow_table_connection()
             if not mysql_conn:
                 return False
             
             cursor = mysql_conn.cursor()
-            
-            # Create database if not exists
-            cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{db_name}` CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci")
+            sanitized_table_name, column_names = self.create_import_table(cursor, db_name, table_name, schema)
             mysql_conn.commit()
             
-            # Infer table structure from CSV
-            sanitized_table_name = self.sanitize_name(table_name)
-            columns_sql = []
-            
-            for col in df.columns:
-                sanitized_col = self.sanitize_name(col)
-                # Simple type inference
-                dtype = str(df[col].dtype)
-                if 'int' in dtype:
-                    mysql_type = 'INT'
-                elif 'float' in dtype:
-                    mysql_type = 'DOUBLE'
-                elif 'datetime' in dtype:
-                    mysql_type = 'DATETIME'
-                else:
-                    mysql_type = 'TEXT'
+            if tiny:
+                mysql_conn.start_transaction()
+                record_count = insert_rows(mysql_conn, head_rows, db_name, sanitized_table_name,
+                                           column_names, INSERT_BATCH_SIZE)
+            else:
+                # Load data straight from the file; fall back to INSERTs if the server
+                # does not allow LOAD DATA LOCAL INFILE
+                try:
+                    record_count = load_data_local_infile(cursor, csv_file, db_name, sanitized_table_name,
+                                                          column_names)
+                except mysql.connector.Error as e:
+                    self.logger.warning(f"LOAD DATA LOCAL INFILE failed, falling back to INSERT: {e}")
+                    record_count = None
                 
-                columns_sql.append(f"`{sanitized_col}` {mysql_type}")
+                if record_count is None:
+                    # Undo whatever LOAD DATA did; all batches go into one transaction, committed below
+                    mysql_conn.rollback()
+                    mysql_conn.start_transaction()
+                    record_count = self.insert_csv_rows(mysql_conn, csv_file, header, db_name,
+                                                        sanitized_table_name, column_names,
+                                                        [mysql_type for _, mysql_type in schema])
+            mysql_conn.commit()
             
-            # Create table
-            create_sql = f"""
-            CREATE TABLE IF NOT EXISTS `{db_name}`.`{sanitized_table_name}` (
-                {',\n    '.join(columns_sql)}
-            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
-            """
+            self.logger.info(f"Successfully imported {record_count} records from CSV")
+            return True
             
-            cursor.execute(create_sql)
-            mysql_conn.commit()
+        except Exception as e:
+            self.logger.error(f"Failed to import CSV {csv_file}: {e}")
+            self.drop_table_connection()
+            return False
+    
+    def import_exported_csv(self, csv_file: Path, db_name: str, table_name: str) -> bool:
+        """Import a CSV exported for one table, then delete it."""
+        try:
+            return self.import_csv_to_mysql(csv_file, db_name, table_name)
+        finally:
+            csv_file.unlink(missing_ok=True)
+    
+    @staticmethod
+    def infer_export_column_type(values) -> str:
+        """Pick a MySQL type for a column of exported text values (None is NULL)."""
+        present = [v for v in values if v is not None]
+        if not present:
+            return 'TEXT'
+        if all(_EXPORT_INT_RE.fullmatch(v) and BIGINT_MIN <= int(v) <= BIGINT_MAX for v in present):
+            return 'BIGINT'
+        try:
+            for v in present:
+                float(v)
+            return 'DOUBLE'
+        except ValueError:
+            pass
+        if all(_EXPORT_DATETIME_RE.fullmatch(v) for v in present):
+            return 'DATETIME'
+        return 'TEXT'
+    
+    def infer_text_schema(self, header: list, rows: list) -> list:
+        """Infer (column name, MySQL type) pairs from rows of exported text values."""
+        return [(col, self.infer_export_column_type(values)) for col, values in zip(header, zip(*rows))]
+    
+    def iter_mdb_export(self, db_path: Path, table_name: str, header: bool = True):
+        """Run mdb-export for one table and yield its header, then lists of row tuples.
+        
+        Batches hold INSERT_BATCH_SIZE rows at most, with None for NULL. Raises
+        RuntimeError with mdb-export's error output if the export fails; closing the
+        generator early kills the process. With header=False only batches are yielded.
+        """
+        proc = subprocess.Popen(['mdb-export', '-D', MDB_EXPORT_DATE_FORMAT, str(db_path), table_name],
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=1 << 20)
+        
+        # Drain stderr on its own thread, so a chatty mdb-export cannot stall on a full
+        # pipe while stdout is being read; the text is raised if the export fails
+        stderr_output = []
+        stderr_reader = threading.Thread(target=lambda: stderr_output.append(proc.stderr.read()), daemon=True)
+        stderr_reader.start()
+        
+        try:
+            reader = csv.reader(io.TextIOWrapper(proc.stdout, encoding='utf-8', newline=''))
+            columns = next(reader, None)
+            if header:
+                yield columns
             
-            # Insert data
-            df.columns = [self.sanitize_name(col) for col in df.columns]
-            df = df.where(pd.notnull(df), None)
+            # mdb-export writes NULL as an empty field
+            while batch := [tuple(v if v != '' else None for v in row) for row in islice(reader, INSERT_BATCH_SIZE)]:
+                yield batch
             
-            columns = ', '.join([f"`{col}`" for col in df.columns])
-            placeholders = ', '.join(['%s'] * len(df.columns))
-            insert_sql = f"INSERT INTO `{db_name}`.`{sanitized_table_name}` ({columns}) VALUES ({placeholders})"
+            if proc.wait() != 0:
+                stderr_reader.join()
+                message = b''.join(stderr_output).decode('utf-8', errors='replace').strip()
+                raise RuntimeError(f"mdb-export failed for table {table_name}: {message}")
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+            stderr_reader.join()
+            proc.stdout.close()
+            proc.stderr.close()
+    
+    def import_mdb_table(self, db_path: Path, db_name: str, table_name: str) -> bool:
+        """Stream one table from mdb-export straight into MySQL, without a temp CSV.
+        
+        Column types are inferred from the first INSERT_BATCH_SIZE rows and widened
+        if later rows do not fit them (see insert_row_batches); all rows are inserted
+        in one transaction.
+        """
+        export = self.iter_mdb_export(db_path, table_name)
+        try:
+            header = next(export)
+            first_batch = next(export, [])
+            if header is None or not first_batch:
+                # Runs the export to the end, raising if it failed
+                next(export, None)
+                return True
+            
+            schema = self.infer_text_schema(header, first_batch)
+            
+            mysql_conn = self.borrow_table_connection()
+            if not mysql_conn:
+                return False
             
-            values = [tuple(row) for row in df.values]
-            cursor.executemany(insert_sql, values)
+            cursor = mysql_conn.cursor()
+            sanitized_table_name, column_names = self.create_import_table(cursor, db_name, table_name, schema)
             mysql_conn.commit()
             
-            mysql_conn.close()
+            def exported_batches():
+                yield first_batch
+                yield from export
+            
+            # The export already running is used first; widening a column exports the table again
+            mysql_conn.start_transaction()
+            record_count = self.insert_row_batches(mysql_conn, exported_batches(),
+                                                   lambda: self.iter_mdb_export(db_path, table_name, header=False),
+                                                   db_name, sanitized_table_name, column_names,
+                                                   [mysql_type for _, mysql_type in schema])
+            mysql_conn.commit()
             
-            self.logger.info(f"Successfully imported {len(df)} records from CSV")
+            self.logger.info(f"Successfully imported {record_count} records from {table_name}")
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to import CSV {csv_file}: {e}")
+            self.logger.error(f"Failed to import table {table_name}: {e}")
+            self.drop_table_connection()
             return False
+        finally:
+            export.close()
     
     def convert_via_mdb_tools(self, db_path: Path) -> bool:
         """Convert using mdb-tools (Linux/Mac/Windows with WSL)."""
@@ -217,27 +800,18 @@ class LegacyAccessConverter(AccessToMySQLConverter):
             self.logger.info(f"Found {len(tables)} tables via mdb-tools")
             
             db_name = self.sanitize_name(db_path.stem)
-            temp_dir = Path(tempfile.mkdtemp())
             
-            # Export each table
-            for table_name in tables:
-                if table_name.startswith('MSys'):
-                    continue
-                    
+            def export_and_import(table_name):
+                return self.import_mdb_table(db_path, db_name, table_name)
+            
+            # Export and import tables concurrently; they do not depend on each other
+            tables = [t for t in tables if not t.startswith('MSys')]
+            if tables:
                 try:
-                    csv_file = temp_dir / f"{table_name}.csv"
-                    
-                    # Export table to CSV
-                    with open(csv_file, 'w') as f:
-                        result = subprocess.run(['mdb-export', str(db_path), table_name], 
-                                              stdout=f, text=True)
-                    
-                    if result.returncode == 0:
-                        self.import_csv_to_mysql(csv_file, db_name, table_name)
-                    
-                except Exception as e:
-                    self.logger.error(f"Failed to export table {table_name}: {e}")
-                    continue
+                    with ThreadPoolExecutor(max_workers=min(self.table_workers, len(tables))) as executor:
+                        list(executor.map(export_and_import, tables))
+                finally:
+                    self.release_table_connections()
             
             return True
             
@@ -289,6 +863,8 @@ def main():
     parser.add_argument("--user", required=True, help="MySQL username")
     parser.add_argument("--password", required=True, help="MySQL password")
     parser.add_argument("--log-dir", default="logs", help="Directory for log files (default: logs)")
+    parser.add_argument("--parallelism", type=int, default=1,
+                        help="Number of databases to convert in parallel worker processes (default: 1)")
     
     args = parser.parse_args()
     
@@ -301,7 +877,7 @@ def main():
     }
     
     # Use legacy converter
-    converter = LegacyAccessConverter(args.source_dir, mysql_config, args.log_dir)
+    converter = LegacyAccessConverter(args.source_dir, mysql_config, args.log_dir, args.parallelism)
     report = converter.run_conversion()
     
     if report['statistics']['databases_failed'] == 0:
@@ -0,0 +1,183 @@
+"""
+Shared helpers for loading rows into MySQL.
+Used by the ODBC, legacy MDB and CSV converters.
+"""
+
+import re
+import logging
+import weakref
+from itertools import islice
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Characters not allowed in MySQL identifiers produced by sanitize_identifier
+_SANITIZE_RE = re.compile(r'[^\w]')
+
+# The ASCII characters _SANITIZE_RE replaces, as a str.translate table; ASCII names
+# (nearly all of them) skip the regex
+_ASCII_SANITIZE_TABLE = str.maketrans({chr(c): '_' for c in range(128)
+                                       if not (chr(c).isalnum() or chr(c) == '_')})
+
+# InnoDB's row size limit; VARCHAR(n) counts 4 bytes per character under utf8mb4
+INNODB_ROW_SIZE_LIMIT = 65535
+
+# Server-side prepared statements accept at most this many placeholders
+MAX_PREPARED_PLACEHOLDERS = 65535
+
+# Default number of rows per extended INSERT, before the placeholder limit applies
+INSERT_BATCH_ROWS = 10000
+
+# Share of max_allowed_packet a batch's values may fill, leaving room for the
+# statement and the protocol's per-value overhead
+PACKET_FILL_RATIO = 0.75
+
+# Bytes counted for a value that is not text or bytes (numbers, dates, NULL)
+FIXED_VALUE_BYTES = 8
+
+# max_allowed_packet per connection, queried once by max_allowed_packet()
+_packet_sizes = weakref.WeakKeyDictionary()
+
+
+def sanitize_identifier(name: str) -> str:
+    """Turn a database/table/column name into a valid lower-case MySQL identifier."""
+    if name.isascii():
+        sanitized = name.translate(_ASCII_SANITIZE_TABLE)
+    else:
+        sanitized = _SANITIZE_RE.sub('_', name)
+    # Ensure it doesn't start with a number
+    if sanitized[0].isdigit():
+        sanitized = f"db_{sanitized}"
+    return sanitized.lower()[:64]
+
+
+def quote_identifier(name: str) -> str:
+    """Quote a MySQL identifier, escaping any embedded backticks."""
+    return "`" + name.replace("`", "``") + "`"
+
+
+def qualified_table_name(db_name: str, table_name: str) -> str:
+    """Quote a table as `database`.`table`."""
+    return f"{quote_identifier(db_name)}.{quote_identifier(table_name)}"
+
+
+def load_data_local_infile(cursor, csv_file: Path, db_name: str, table_name: str, columns: list,
+                           charset: str = 'utf8mb4', delimiter: str = ',', quotechar: str = '"'):
+    """Load a CSV file with a header line into an existing table with LOAD DATA LOCAL INFILE.
+    
+    Empty fields become NULL. Returns the number of rows loaded, or None if the load
+    raised warnings: with LOCAL, values that do not fit the column types are coerced
+    or truncated with only a warning, even in strict mode. The caller must then roll
+    back the load. Does not commit.
+    """
+    # Read each field into a variable so empty fields become NULL like in pandas
+    variables = [f"@c{i}" for i in range(len(columns))]
+    assignments = ', '.join(
+        f"{quote_identifier(col)} = NULLIF(TRIM(TRAILING '\\r' FROM {var}), '')"
+        for col, var in zip(columns, variables)
+    )
+    load_sql = (
+        f"LOAD DATA LOCAL INFILE %s INTO TABLE {qualified_table_name(db_name, table_name)} "
+        f"CHARACTER SET {charset} "
+        f"FIELDS TERMINATED BY %s OPTIONALLY ENCLOSED BY %s ESCAPED BY '' "
+        f"LINES TERMINATED BY '\\n' IGNORE 1 LINES "
+        f"({', '.join(variables)}) SET {assignments}"
+    )
+    cursor.execute(load_sql, (str(csv_file.absolute()), delimiter, quotechar))
+    
+    warning_count = cursor.warning_count
+    if warning_count:
+        cursor.execute("SHOW WARNINGS LIMIT 1")
+        _, _, message = cursor.fetchone()
+        logger.warning(f"LOAD DATA LOCAL INFILE raised {warning_count} warnings ({message}), "
+                       "falling back to INSERT")
+        return None
+    return cursor.rowcount
+
+
+def max_allowed_packet(conn) -> int:
+    """Return the server's max_allowed_packet for a connection, querying it only once."""
+    size = _packet_sizes.get(conn)
+    if size is None:
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT @@max_allowed_packet")
+            size = int(cursor.fetchone()[0])
+        finally:
+            cursor.close()
+        _packet_sizes[conn] = size
+    return size
+
+
+def row_bytes(row) -> int:
+    """Estimate the bytes a row's values take in an INSERT packet."""
+    total = 0
+    for value in row:
+        if isinstance(value, str):
+            # utf8mb4 takes up to 4 bytes per non-ASCII character
+            total += len(value) if value.isascii() else 4 * len(value)
+        elif isinstance(value, (bytes, bytearray)):
+            total += len(value)
+        else:
+            total += FIXED_VALUE_BYTES
+    return total
+
+
+def insert_rows(conn, rows, db_name: str, table_name: str, columns: list,
+                max_batch_rows: int = INSERT_BATCH_ROWS) -> int:
+    """Insert an iterable of row tuples into an existing table with prepared extended INSERTs.
+    
+    Rows are pulled one batch at a time, so a generator is never fully materialised;
+    each statement carries at most max_batch_rows rows, MAX_PREPARED_PLACEHOLDERS
+    values and PACKET_FILL_RATIO of the server's max_allowed_packet (a single row
+    larger than that still goes alone). Does not commit; returns the number of
+    rows inserted.
+    """
+    if not columns:
+        logger.warning(f"No columns to insert into {table_name}, skipping its rows")
+        return 0
+    
+    column_list = ', '.join([quote_identifier(col) for col in columns])
+    row_placeholders = '(' + ', '.join(['%s'] * len(columns)) + ')'
+    insert_prefix = f"INSERT INTO {qualified_table_name(db_name, table_name)} ({column_list}) VALUES "
+    
+    # Every full batch reuses the same statement, so the server parses it only once
+    batch_size = max(1, min(max_batch_rows, MAX_PREPARED_PLACEHOLDERS // len(columns)))
+    full_batch_sql = insert_prefix + ', '.join([row_placeholders] * batch_size)
+    packet_budget = int(max_allowed_packet(conn) * PACKET_FILL_RATIO)
+    cursor = conn.cursor(prepared=True)
+    
+    total_rows = 0
+    batch_number = 0
+    rows = iter(rows)
+    # A row that would have overflowed the previous batch's packet starts the next one
+    carried = []
+    try:
+        while True:
+            batch = carried
+            carried = []
+            batch_bytes = sum(map(row_bytes, batch))
+            for row in islice(rows, batch_size - len(batch)):
+                size = row_bytes(row)
+                if batch and batch_bytes + size > packet_budget:
+                    carried = [row]
+                    break
+                batch.append(row)
+                batch_bytes += size
+            if not batch:
+                break
+            
+            batch_number += 1
+            if len(batch) == batch_size:
+                insert_sql = full_batch_sql
+            else:
+                insert_sql = insert_prefix + ', '.join([row_placeholders] * len(batch))
+            cursor.execute(insert_sql, [val for row in batch for val in row])
+            total_rows += len(batch)
+            
+            # Lazy %-formatting: the message is only built if a handler accepts it
+            level = logging.INFO if batch_number % 10 == 0 else logging.DEBUG
+            logger.log(level, "Inserted batch %d (%d rows so far)", batch_number, total_rows)
+    finally:
+        cursor.close()
+    return total_rows
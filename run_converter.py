@@ -137,6 +137,8 @@ def main():
         print(f"  Failed: {stats['databases_failed']}")
         print(f"  Tables converted: {stats['tables_converted']}")
         print(f"  Records migrated: {stats['records_migrated']}")
+        if stats['records_skipped']:
+            print(f"  Records skipped: {stats['records_skipped']}")
         
         success_rate = (stats['databases_converted'] / max(stats['databases_found'], 1)) * 100
         print(f"  Success rate: {success_rate:.1f}%")
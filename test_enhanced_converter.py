@@ -141,6 +141,203 @@ def test_integration():
         print(f"❌ Integration test failed: {e}")
         return False
 
+def test_bulk_load_helpers():
+    """Test identifier quoting and INSERT batch sizing without a MySQL server"""
+    print("\n📦 Testing Bulk Load Helpers...")
+    
+    try:
+        from mysql_bulk_load import (MAX_PREPARED_PLACEHOLDERS, insert_rows, quote_identifier,
+                                     sanitize_identifier)
+        
+        # Test identifier sanitising and quoting
+        cases = [("Order Details", "order_details"), ("2020 Sales", "db_2020_sales"),
+                 ("Straße-Ä", "straße_ä"), ("x" * 80, "x" * 64)]
+        for name, expected in cases:
+            if sanitize_identifier(name) != expected:
+                print(f"❌ Identifier sanitising failed: got {sanitize_identifier(name)}, expected {expected}")
+                return False
+        if quote_identifier("a`b") != "`a``b`":
+            print(f"❌ Identifier quoting failed: got {quote_identifier('a`b')}")
+            return False
+        print("✅ Identifier sanitising and quoting work correctly")
+        
+        class FakeCursor:
+            def __init__(self, conn):
+                self.conn = conn
+            def execute(self, sql, params=None):
+                if params is not None:
+                    self.conn.batches.append(len(params) // self.conn.column_count)
+            def fetchone(self):
+                return (self.conn.max_allowed_packet,)
+            def close(self):
+                pass
+        
+        class FakeConnection:
+            def __init__(self, column_count, max_allowed_packet=64 << 20):
+                self.column_count = column_count
+                self.max_allowed_packet = max_allowed_packet
+                self.batches = []
+            def cursor(self, **kwargs):
+                return FakeCursor(self)
+        
+        # Test the placeholder cap: 1000 columns allow 65 rows per statement
+        conn = FakeConnection(1000)
+        rows = [tuple(range(1000))] * 150
+        inserted = insert_rows(conn, iter(rows), "db", "t", [f"c{i}" for i in range(1000)])
+        per_statement = MAX_PREPARED_PLACEHOLDERS // 1000
+        if inserted != 150 or conn.batches != [per_statement, per_statement, 150 - 2 * per_statement]:
+            print(f"❌ Placeholder cap failed: inserted {inserted} in batches {conn.batches}")
+            return False
+        
+        # Test batch sizing by row count and by max_allowed_packet
+        conn = FakeConnection(2)
+        insert_rows(conn, [(i, "x") for i in range(25)], "db", "t", ["a", "b"], max_batch_rows=10)
+        if conn.batches != [10, 10, 5]:
+            print(f"❌ Row batch sizing failed: got batches {conn.batches}")
+            return False
+        conn = FakeConnection(2, max_allowed_packet=1000)
+        insert_rows(conn, [(i, "x" * 100) for i in range(20)] + [(0, "y" * 5000)], "db", "t", ["a", "b"])
+        if sum(conn.batches) != 21 or max(conn.batches) > 6 or conn.batches[-1] != 1:
+            print(f"❌ Packet batch sizing failed: got batches {conn.batches}")
+            return False
+        if insert_rows(FakeConnection(1), [(), ()], "db", "t", []) != 0:
+            print("❌ Inserting without columns did not skip the rows")
+            return False
+        print("✅ Placeholder cap and batch sizing work correctly")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Bulk load helper test failed: {e}")
+        return False
+
+def test_batch_bisect():
+    """Test that a failed batch is split until only the bad rows are skipped"""
+    print("\n✂️  Testing Batch Bisection...")
+    
+    try:
+        from access_to_mysql_converter import AccessToMySQLConverter
+    except (ImportError, SystemExit) as e:
+        print(f"⚠️  Skipped, converter dependencies missing: {e}")
+        return True
+    
+    try:
+        class FakeCursor:
+            def __init__(self):
+                self.inserted = []
+                self.calls = 0
+            def executemany(self, sql, values):
+                self.calls += 1
+                if any(row[1] is None for row in values):
+                    raise ValueError("Column 'name' cannot be null")
+                self.inserted.extend(values)
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            converter = AccessToMySQLConverter(temp_dir, {}, "test_logs")
+            rows = [(i, None if i in (3, 97) else f"name{i}") for i in range(100)]
+            cursor = FakeCursor()
+            skipped = converter.insert_batch_bisect(cursor, "INSERT", rows)
+        
+        good_rows = [row for row in rows if row[1] is not None]
+        if skipped != 2 or sorted(cursor.inserted) != good_rows:
+            print(f"❌ Bisection failed: skipped {skipped}, inserted {len(cursor.inserted)} rows")
+            return False
+        if cursor.calls > 40:
+            print(f"❌ Bisection took {cursor.calls} round-trips for 2 bad rows")
+            return False
+        print("✅ Bisection isolates only the bad rows")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Bisection test failed: {e}")
+        return False
+
+def test_type_inference():
+    """Test column type inference for CSV files and mdb-export text"""
+    print("\n🔎 Testing Type Inference...")
+    
+    try:
+        import pandas as pd
+        from csv_to_mysql_converter import CSVToMySQLConverter
+        from legacy_mdb_converter import LegacyAccessConverter
+    except (ImportError, SystemExit) as e:
+        print(f"⚠️  Skipped, converter dependencies missing: {e}")
+        return True
+    
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_converter = CSVToMySQLConverter(temp_dir, {}, "test_db")
+            legacy_converter = LegacyAccessConverter(temp_dir, {}, "test_logs")
+        
+        # NOT NULL only for columns complete in every chunk, types merged across chunks
+        chunks = [
+            pd.DataFrame({'id': [1, 2], 'name': ['a', 'b'], 'amount': [1, 2]}),
+            pd.DataFrame({'id': [3, 4], 'name': ['c', None], 'amount': [1.5, 300000]}),
+        ]
+        columns = csv_converter.profile_columns(iter(chunks))
+        not_null = {name: flag for name, _, flag in columns}
+        if not_null != {'id': True, 'name': False, 'amount': True}:
+            print(f"❌ NOT NULL profiling failed: got {columns}")
+            return False
+        if dict((name, mysql_type) for name, mysql_type, _ in columns)['amount'] != 'DOUBLE':
+            print(f"❌ Type merging across chunks failed: got {columns}")
+            return False
+        if csv_converter.profile_columns(iter([pd.DataFrame({'id': []})])) is not None:
+            print("❌ A file without data rows was profiled")
+            return False
+        print("✅ Columns are profiled across the whole file")
+        
+        # Exported text values, including negatives, dates and out-of-range integers
+        header = ['id', 'balance', 'created', 'note', 'huge', 'empty']
+        rows = [
+            ('1', '-12.5', '2020-01-31 00:00:00', 'abc', str(2 ** 63), None),
+            ('-7', '3', '1999-12-31 23:59:59', '12', '1', None),
+        ]
+        expected = [('id', 'BIGINT'), ('balance', 'DOUBLE'), ('created', 'DATETIME'),
+                    ('note', 'TEXT'), ('huge', 'DOUBLE'), ('empty', 'TEXT')]
+        schema = legacy_converter.infer_text_schema(header, rows)
+        if schema != expected:
+            print(f"❌ Text type inference failed: got {schema}, expected {expected}")
+            return False
+        if (LegacyAccessConverter.widen_export_type('BIGINT', ['2.5']) != 'DOUBLE' or
+                LegacyAccessConverter.widen_export_type('DATETIME', ['-1']) != 'TEXT'):
+            print("❌ Column widening failed")
+            return False
+        print("✅ Text type inference works correctly")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Type inference test failed: {e}")
+        return False
+
+def test_lock_file_discovery():
+    """Test finding Access lock files in a directory tree"""
+    print("\n🔒 Testing Lock File Discovery...")
+    
+    try:
+        from fix_database_locks import iter_lock_files
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            (root / "sub" / "deeper").mkdir(parents=True)
+            lock_files = [root / "a.ldb", root / "sub" / "B.LACCDB", root / "sub" / "deeper" / "~$c.mdb"]
+            other_files = [root / "a.mdb", root / "sub" / "notes.txt", root / "sub" / "ldb.accdb"]
+            for path in lock_files + other_files:
+                path.touch()
+            
+            found = sorted(iter_lock_files(temp_dir))
+            expected = sorted(str(path) for path in lock_files)
+            if found != expected:
+                print(f"❌ Lock file discovery failed: got {found}, expected {expected}")
+                return False
+        
+        print("✅ Lock file discovery works correctly")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Lock file discovery test failed: {e}")
+        return False
+
 def main():
     """Run all tests"""
     print("🚀 Enhanced Access COM Converter Test Suite")
@@ -154,6 +351,10 @@ def main():
     if not test_integration():
         success = False
     
+    for test in (test_bulk_load_helpers, test_batch_bisect, test_type_inference, test_lock_file_discovery):
+        if not test():
+            success = False
+    
     print("\n" + "=" * 60)
     if success:
         print("🎉 ALL TESTS PASSED! The enhanced converter is ready to use.")